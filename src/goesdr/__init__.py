@@ -10,6 +10,7 @@ from . import netcdf
 from .dataset import GOESDatasetInfo
 from .geodetic import (
     GOESGeodeticGrid,
+    GOESGeodeticGridScratch,
     GOESLatLonGrid,
     GOESLatLonGridData,
     GOESLatLonGridInfo,
@@ -28,6 +29,7 @@ __all__ = [
     "GOESABIFixedGrid",
     "GOESDatasetInfo",
     "GOESGeodeticGrid",
+    "GOESGeodeticGridScratch",
     "GOESGlobe",
     "GOESImage",
     "GOESImageMetadata",
@@ -8,6 +8,8 @@ Classes
 -------
 GOESGeodeticGrid
     Hold GOES satellite precomputed latitude and longitude data.
+GOESGeodeticGridScratch
+    Hold preallocated buffers for calculated geodetic grids.
 GOESLatLonGridData
     Represent GOES satellite precomputed latitude or longitude data.
 GOESLatLonGridMetadata
@@ -18,21 +20,37 @@ GOESLatLonGridInfo
     Hold GOES geodetic grid dataset metadata information.
 """
 
-from re import match
+from collections.abc import Callable
+from functools import lru_cache
+from re import compile as compile_regex
 from typing import Any, cast
+from weakref import WeakKeyDictionary
 
 from netCDF4 import Dataset  # pylint: disable=no-name-in-module
-from numpy import errstate, float32, nan
-from numpy.ma import masked_invalid
+from numpy import (
+    False_,
+    bool_,
+    broadcast_to,
+    copyto,
+    empty,
+    errstate,
+    float32,
+    isfinite,
+    logical_not,
+    nan,
+)
 
 from .array import ArrayBool, ArrayFloat32, ArrayFloat64, MaskedFloat32
 from .grid import (
     ProjectionParameters,
     calculate_latlon_grid_cartopy,
+    calculate_latlon_grid_cuda,
     calculate_latlon_grid_goesdr,
+    calculate_latlon_grid_numba,
     calculate_latlon_grid_pyproj,
     calculate_pixel_edges,
 )
+from .grid.cache import load_grid, make_grid_key, store_grid
 from .netcdf import DatasetView, HasStrHelp, dimension, variable
 from .projection import GOESProjection
 
@@ -52,6 +70,8 @@ class GOESLatLonGridData:
         The fill value used for missing or invalid data points.
     """
 
+    __slots__ = ("data", "mask", "fill_value")
+
     def __init__(self, array: MaskedFloat32) -> None:
         """
         Initialize a GOESLatLonGridData object.
@@ -66,18 +86,72 @@ class GOESLatLonGridData:
         self.mask = array.mask
         self.fill_value = array.fill_value
 
+    @classmethod
+    def from_parts(
+        cls, data: ArrayFloat32, mask: ArrayBool, fill_value: float32
+    ) -> "GOESLatLonGridData":
+        """
+        Create a GOESLatLonGridData object from its parts.
+
+        Parameters
+        ----------
+        data : ArrayFloat32
+            The latitude or longitude grid data.
+        mask : ArrayBool
+            The array containing the mask values indicating invalid
+            data points.
+        fill_value : float32
+            The fill value used for missing or invalid data points.
+
+        Returns
+        -------
+        GOESLatLonGridData
+            The latitude or longitude grid data.
+        """
+        grid = cls.__new__(cls)
+        grid.data = data
+        grid.mask = mask
+        grid.fill_value = fill_value
+        return grid
+
     data: ArrayFloat32
     mask: ArrayBool
     fill_value: float32
 
 
-def _latlon_data(
-    name: str, record: Dataset, step: tuple[int, int] | None
-) -> GOESLatLonGridData:
+# Largest variable, in bytes, read whole before subsampling. The whole
+# read holds the full resolution data and mask at once, e.g. ~2 GiB of
+# data for a 0.5 km full disk grid, larger grids keep the strided read.
+_WHOLE_READ_LIMIT = 64 << 20
+
+
+def _prefers_whole_read(variable_: Any, step: tuple[int, int]) -> bool:
+    # Whether a subsampled variable is read faster whole, i.e. a strided
+    # read would decode every one of its chunks anyway, the chunks being
+    # not smaller than the step, and netCDF strided reads of chunked
+    # variables are slow. Only variables of moderate size qualify.
+    if variable_.size * variable_.dtype.itemsize > _WHOLE_READ_LIMIT:
+        return False
+    chunking = variable_.chunking()
+    if chunking == "contiguous":
+        return False
+    return all(length >= stride for length, stride in zip(chunking, step))
+
+
+@lru_cache(maxsize=32)
+def _latlon_data_view(
+    name: str, step: tuple[int, int] | None
+) -> type[DatasetView]:
+    # Build the view class once per variable and subsampling step, class
+    # creation generates and compiles the view initializer.
     latlon = variable(name)
 
     def _subsample(x: Any) -> Any:
-        return x[:] if step is None else x[:: step[0], :: step[1]]
+        if step is None:
+            return x[:]
+        if _prefers_whole_read(x, step):
+            return x[:][:: step[0], :: step[1]].copy()
+        return x[:: step[0], :: step[1]]
 
     class _GOESLatLonGridData(DatasetView):
         data: ArrayFloat32 = latlon.data(filter=_subsample)
@@ -88,7 +162,13 @@ def _latlon_data(
     _GOESLatLonGridData.__name__ = GOESLatLonGridData.__name__
     _GOESLatLonGridData.__qualname__ = GOESLatLonGridData.__qualname__
 
-    data = _GOESLatLonGridData(record)
+    return _GOESLatLonGridData
+
+
+def _latlon_data(
+    name: str, record: Dataset, step: tuple[int, int] | None
+) -> GOESLatLonGridData:
+    data = _latlon_data_view(name, step)(record)
 
     return cast(GOESLatLonGridData, data)
 
@@ -160,7 +240,9 @@ class GOESLatLonGridMetadataType:
     comment: str
 
 
-def _latlon_metadata(name: str, record: Dataset) -> GOESLatLonGridMetadataType:
+@lru_cache(maxsize=8)
+def _latlon_metadata_view(name: str) -> type[DatasetView]:
+    # Build the view class once per variable, see _latlon_data_view.
     latlon = variable(name)
 
     class _GOESLatLonGridMetadata(DatasetView):
@@ -175,7 +257,11 @@ def _latlon_metadata(name: str, record: Dataset) -> GOESLatLonGridMetadataType:
         GOESLatLonGridMetadataType.__qualname__
     )
 
-    metadata = _GOESLatLonGridMetadata(record)
+    return _GOESLatLonGridMetadata
+
+
+def _latlon_metadata(name: str, record: Dataset) -> GOESLatLonGridMetadataType:
+    metadata = _latlon_metadata_view(name)(record)
 
     return cast(GOESLatLonGridMetadataType, metadata)
 
@@ -227,6 +313,83 @@ class GOESLatLonGridInfo(DatasetView):
 
 FILL_VALUE = -999.99
 
+# The projection information of a dataset is read once per dataset and
+# shared by all the grids calculated from it, dataset views are frozen.
+_projection_cache: WeakKeyDictionary[Dataset, GOESProjection] = (
+    WeakKeyDictionary()
+)
+
+_GridBackend = Callable[..., tuple[ArrayFloat32, ArrayFloat32]]
+
+_ALGORITHM_PATTERN = compile_regex(r"^(\w+)(?:\[(\w+)\])?$")
+# Backends that flag the pixels off the Earth disk themselves and write
+# into the given buffers, and backends built on other packages.
+_MASKING_BACKENDS: dict[str, _GridBackend] = {
+    "cuda": calculate_latlon_grid_cuda,
+    "goesdr": calculate_latlon_grid_goesdr,
+    "numba": calculate_latlon_grid_numba,
+}
+_PACKAGE_BACKENDS: dict[str, _GridBackend] = {
+    "cartopy": calculate_latlon_grid_cartopy,
+    "pyproj": calculate_latlon_grid_pyproj,
+}
+_ALGORITHMS = frozenset(_MASKING_BACKENDS) | frozenset(_PACKAGE_BACKENDS)
+_MASKING_ALGORITHMS = frozenset(_MASKING_BACKENDS)
+_OPTIONS = frozenset({None, "center", "corner"})
+
+
+class GOESGeodeticGridScratch:
+    """
+    Hold preallocated buffers for calculated geodetic grids.
+
+    Batch processing of many datasets of the same sector can reuse these
+    buffers instead of allocating new grids for every dataset, see
+    GOESGeodeticGrid.calculate. The grids calculated with a scratch
+    share its buffers and are overwritten by the next calculation.
+
+    Attributes
+    ----------
+    latitude : ArrayFloat32
+        The latitude grid buffer.
+    longitude : ArrayFloat32
+        The longitude grid buffer.
+    mask : ArrayBool
+        The mask buffer.
+    """
+
+    __slots__ = ("latitude", "longitude", "mask")
+
+    latitude: ArrayFloat32
+    longitude: ArrayFloat32
+    mask: ArrayBool
+
+    def __init__(self, shape: tuple[int, int]) -> None:
+        """
+        Initialize a GOESGeodeticGridScratch object.
+
+        Parameters
+        ----------
+        shape : tuple[int, int]
+            The number of rows and columns of the calculated grids,
+            i.e. of the subsampled ABI fixed grid, plus one in each
+            direction for the 'corner' option.
+        """
+        self.latitude = empty(shape, dtype=float32)
+        self.longitude = empty(shape, dtype=float32)
+        self.mask = empty(shape, dtype=bool_)
+
+
+def _fill_masked(data: ArrayFloat32, mask: ArrayBool) -> None:
+    # Set the masked points of a grid to NaN in place. Uniform masks,
+    # i.e. zero-strided broadcasts such as the mask of a grid with no
+    # masked points, are resolved from their first element instead of
+    # being scanned.
+    if not any(mask.strides):
+        if mask.size and mask.flat[0]:
+            data.fill(nan)
+        return
+    copyto(data, nan, where=mask)
+
 
 class GOESGeodeticGrid(HasStrHelp):
     """
@@ -281,6 +444,7 @@ class GOESGeodeticGrid(HasStrHelp):
         record: Dataset,
         algorithm: str = "goesdr",
         step: int | tuple[int, int] = 1,
+        scratch: GOESGeodeticGridScratch | None = None,
     ) -> "GOESGeodeticGrid":
         """
         Compute the geodetic grids and initialize a GOESGrid object.
@@ -302,22 +466,35 @@ class GOESGeodeticGrid(HasStrHelp):
             The netCDF dataset containing ABI Level 2 data.
         algorithm : str, optional
             The algorithm to use to calculate the latitude and longitude
-            grid data. Choose 'cartopy', 'goesdr', or 'pyproj'.
-            'cartopy' or 'pyproj' requires the respective Python package
-            to be installed.  'goesdr' is the default algorithm and does
-            not require any additional packages.
+            grid data. Choose 'cartopy', 'cuda', 'goesdr', 'numba', or
+            'pyproj'. 'cartopy' or 'pyproj' requires the respective
+            Python package to be installed, 'numba' runs the 'goesdr'
+            equations in a compiled kernel and requires the 'numba'
+            package, 'cuda' requires the 'numba' package and a CUDA GPU.
+            'goesdr' is the default algorithm and does not require any
+            additional packages.
         step : int or tuple[int, int], optional
             The step size to subsample the latitude and longitude grid
             data. If an integer is provided, the step size is the same
             for both rows and columns. If a tuple is provided, the first
             value is the step size for grid rows and the second value is
             the step size for grid columns. The default is 1.
+        scratch : GOESGeodeticGridScratch, optional
+            Preallocated buffers, of the shape of the calculated grids,
+            the grids are written to. The returned grids share these
+            buffers. New arrays are allocated by default.
 
         Returns
         -------
         GOESLatLonGrid
             The latitude and longitude grid data.
 
+        Raises
+        ------
+        ValueError
+            If the shape of the scratch buffers does not match the shape
+            of the calculated grids.
+
         References
         ----------
         .. [1] STAR Atmospheric Composition Product Training, "GOES
@@ -338,7 +515,7 @@ class GOESGeodeticGrid(HasStrHelp):
         step = cls._parse_step(step)
 
         abi_lat, abi_lon = cls._initialize_calculated(
-            record, algorithm, corners, step
+            record, algorithm, corners, step, scratch
         )
 
         return GOESGeodeticGrid(abi_lat, abi_lon)
@@ -390,8 +567,8 @@ class GOESGeodeticGrid(HasStrHelp):
         abi_lat = _latlon_data("latitude", record, step)
         abi_lon = _latlon_data("longitude", record, step)
 
-        abi_lat.data[abi_lat.mask] = nan
-        abi_lon.data[abi_lon.mask] = nan
+        _fill_masked(abi_lat.data, abi_lat.mask)
+        _fill_masked(abi_lon.data, abi_lon.mask)
 
         return GOESGeodeticGrid(abi_lat, abi_lon)
 
@@ -402,8 +579,34 @@ class GOESGeodeticGrid(HasStrHelp):
         algorithm: str,
         corners: bool,
         step: tuple[int, int],
+        scratch: GOESGeodeticGridScratch | None,
     ) -> tuple[GOESLatLonGridData, GOESLatLonGridData]:
-        projection_info = GOESProjection(record)
+        parameters = cls._make_parameters(record, corners, step)
+
+        # All the algorithms set both latitude and longitude to NaN for
+        # the pixels off the Earth disk, so the grids share a read-only
+        # mask and no masked array copies are made.
+        shape = (parameters.y.size, parameters.x.size)
+        mask, out = cls._resolve_buffers(shape, scratch)
+        lat, lon, flagged = cls._load_or_calculate(
+            parameters, algorithm, mask, out
+        )
+        mask = cls._finalize_mask(lat, mask, flagged, scratch is not None)
+        fill_value = float32(FILL_VALUE)
+
+        abi_lat = GOESLatLonGridData.from_parts(lat, mask, fill_value)
+        abi_lon = GOESLatLonGridData.from_parts(lon, mask, fill_value)
+
+        return abi_lat, abi_lon
+
+    @staticmethod
+    def _make_parameters(
+        record: Dataset, corners: bool, step: tuple[int, int]
+    ) -> ProjectionParameters:
+        projection_info = _projection_cache.get(record)
+        if projection_info is None:
+            projection_info = GOESProjection(record)
+            _projection_cache[record] = projection_info
 
         if corners:
             x_r = calculate_pixel_edges(projection_info.x)
@@ -430,75 +633,117 @@ class GOESGeodeticGrid(HasStrHelp):
         )
         xy_grid = (x_r, y_r)
 
-        parameters = ProjectionParameters(
+        return ProjectionParameters(
             orbit_parameters, globe_parameters, xy_grid
         )
 
-        lat, lon = cls._calculate_latlon_grid(parameters, algorithm)
+    @staticmethod
+    def _resolve_buffers(
+        shape: tuple[int, int], scratch: GOESGeodeticGridScratch | None
+    ) -> tuple[ArrayBool, tuple[ArrayFloat32, ArrayFloat32] | None]:
+        # Return the mask and the latitude and longitude buffers the
+        # grids are written to, the scratch ones or a new mask and no
+        # grid buffers.
+        if scratch is None:
+            return empty(shape, dtype=bool_), None
+        if scratch.mask.shape != shape:
+            raise ValueError(
+                f"Scratch shape {scratch.mask.shape} does not match "
+                f"the grid shape {shape}."
+            )
+        return scratch.mask, (scratch.latitude, scratch.longitude)
 
-        abi_lat = GOESLatLonGridData(lat)
-        abi_lon = GOESLatLonGridData(lon)
+    @classmethod
+    def _load_or_calculate(
+        cls,
+        parameters: ProjectionParameters,
+        algorithm: str,
+        mask: ArrayBool,
+        out: tuple[ArrayFloat32, ArrayFloat32] | None,
+    ) -> tuple[ArrayFloat32, ArrayFloat32, bool]:
+        # Return the latitude and longitude grids, loaded from the grid
+        # cache or calculated, and whether the mask was flagged while
+        # calculating them.
+        key = make_grid_key(parameters, algorithm)
+        grids = None if key is None else load_grid(key)
+        if grids is None:
+            lat, lon = cls._calculate_latlon_grid(
+                parameters, algorithm, mask, out
+            )
+            if key is not None:
+                store_grid(key, lat, lon)
+        else:
+            lat, lon = grids
+        if out is not None and lat is not out[0]:
+            # Loaded grids and the package backends allocate their own.
+            copyto(out[0], lat)
+            copyto(out[1], lon)
+            lat, lon = out
+        flagged = grids is None and algorithm in _MASKING_ALGORITHMS
+        return lat, lon, flagged
 
-        return abi_lat, abi_lon
+    @staticmethod
+    def _finalize_mask(
+        lat: ArrayFloat32, mask: ArrayBool, flagged: bool, shared: bool
+    ) -> ArrayBool:
+        # The goesdr, numba and cuda algorithms flag the pixels off the
+        # Earth disk while calculating the grids, the others are scanned
+        # here. Grids entirely on the Earth disk, e.g. CONUS or
+        # mesoscale sectors, get a broadcast of False instead of a full
+        # mask. A shared, i.e. scratch, mask stays writeable for the
+        # next calculation, the grids get a read-only view of it.
+        if not flagged:
+            isfinite(lat, out=mask)
+            logical_not(mask, out=mask)
+        if not mask.any():
+            return broadcast_to(False_, lat.shape)
+        if shared:
+            mask = mask.view()
+        mask.flags.writeable = False
+        return mask
 
     @staticmethod
     def _calculate_latlon_grid(
         parameters: ProjectionParameters,
         algorithm: str,
-    ) -> tuple[MaskedFloat32, MaskedFloat32]:
-        # Ignore numpy errors for `sqrt` of negative number; reference
-        # [2] states that this "occurs for GOES-16 ABI CONUS sector
-        # data", however I found it also occurs for Full Disk sector.
+        mask: ArrayBool,
+        out: tuple[ArrayFloat32, ArrayFloat32] | None,
+    ) -> tuple[ArrayFloat32, ArrayFloat32]:
+        # The algorithm name is validated by _parse_algorithm. The goesdr,
+        # numba and cuda algorithms guard their own `sqrt` of negative
+        # numbers, see calculate_latlon_grid_goesdr, numpy errors are
+        # ignored for the package backends.
+        backend = _MASKING_BACKENDS.get(algorithm)
+        if backend is not None:
+            return backend(parameters, mask, out)
+
         with errstate(invalid="ignore"):
-            if algorithm == "goesdr":
-                lat, lon = calculate_latlon_grid_goesdr(parameters)
-            elif algorithm == "pyproj":
-                lat, lon = calculate_latlon_grid_pyproj(parameters)
-            elif algorithm == "cartopy":
-                lat, lon = calculate_latlon_grid_cartopy(parameters)
-            else:
-                raise ValueError(
-                    f"Invalid algorithm '{algorithm}'. Expected pattern: "
-                    "'<algorithm>' or '<algorithm>[<option>]'. "
-                    "Choose 'precomputed', 'noaa', 'opti' (default), "
-                    "'pyproj', or 'cartopy' for '<algorithm>'. Choose "
-                    "'center' (default) or 'corner' for '<option>'. "
-                    "'precomputed' cannot be used with options."
-                )
-
-        latitude: MaskedFloat32 = masked_invalid(lat)  # type: ignore
-        longitude: MaskedFloat32 = masked_invalid(lon)  # type: ignore
-
-        latitude.fill_value = FILL_VALUE
-        longitude.fill_value = FILL_VALUE
-
-        return latitude, longitude
+            return _PACKAGE_BACKENDS[algorithm](parameters)
 
     @staticmethod
     def _parse_algorithm(algorithm: str) -> tuple[str, bool]:
-        pattern = r"^(\w+)(?:\[(\w+)\])?$"
-        match_ = match(pattern, algorithm)
+        match_ = _ALGORITHM_PATTERN.match(algorithm)
 
         if not match_:
             raise ValueError(
                 f"Invalid algorithm '{algorithm}'. Expected pattern: "
                 "'<algorithm>' or '<algorithm>[<option>]'. "
-                "Choose 'cartopy', 'goesdr' (default), or 'pyproj' for "
-                "'<algorithm>'. Choose 'center' (default) or 'corner' "
-                "for '<option>'."
+                "Choose 'cartopy', 'cuda', 'goesdr' (default), 'numba', or "
+                "'pyproj' for '<algorithm>'. Choose 'center' (default) or "
+                "'corner' for '<option>'."
             )
 
         name = match_[1]
 
-        if name not in {"cartopy", "goesdr", "pyproj"}:
+        if name not in _ALGORITHMS:
             raise ValueError(
-                f"Invalid algorithm '{name}'. Choose 'cartopy', 'goesdr', "
-                "or 'pyproj'."
+                f"Invalid algorithm '{name}'. Choose 'cartopy', 'cuda', "
+                "'goesdr', 'numba', or 'pyproj'."
             )
 
         option = match_[2]
 
-        if option not in {None, "center", "corner"}:
+        if option not in _OPTIONS:
             raise ValueError(
                 f"Invalid option '{option}'. Choose 'center' or 'corner'."
             )
@@ -19,9 +19,14 @@ Functions
 ---------
 calculate_latlon_grid_cartopy
     Calculate latitude and longitude grids using the cartopy package.
+calculate_latlon_grid_cuda
+    Calculate latitude and longitude grids on a CUDA GPU using Numba.
 calculate_latlon_grid_goesdr
     Calculate latitude and longitude grids using an optimized version of
     classic's algorithm.
+calculate_latlon_grid_numba
+    Calculate latitude and longitude grids with a kernel compiled by
+    Numba.
 calculate_latlon_grid_pyproj
     Calculate latitude and longitude grids using the pyproj package.
 calculate_pixel_edges
@@ -44,14 +49,18 @@ References
 """
 
 from .grid_cartopy import calculate_latlon_grid_cartopy
+from .grid_cuda import calculate_latlon_grid_cuda
 from .grid_goesdr import calculate_latlon_grid_goesdr
+from .grid_numba import calculate_latlon_grid_numba
 from .grid_pyproj import calculate_latlon_grid_pyproj
 from .helpers import calculate_pixel_edges
 from .parameters import ProjectionParameters
 
 __all__ = [
     "calculate_latlon_grid_cartopy",
+    "calculate_latlon_grid_cuda",
     "calculate_latlon_grid_goesdr",
+    "calculate_latlon_grid_numba",
     "calculate_latlon_grid_pyproj",
     "calculate_pixel_edges",
     "ProjectionParameters",
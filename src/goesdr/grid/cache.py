@@ -0,0 +1,205 @@
+"""
+Provide persistent caching of calculated latitude and longitude grids.
+
+Calculated grids are deterministic functions of the projection
+parameters, the fixed grid coordinates and the algorithm. When the
+'GOESDR_CACHE_DIR' environment variable names a directory, the grids
+are stored there as netCDF files, keyed by these inputs and
+the package version, and subsequent calculations of the same grid load
+them instead. Remove the 'grids' subdirectory to clear the cache.
+
+Functions
+---------
+make_grid_key(parameters, algorithm) -> str | None
+    Make the cache key of a calculated grid.
+load_grid(key: str) -> tuple[ArrayFloat32, ArrayFloat32] | None
+    Load a cached latitude and longitude grid.
+store_grid(key: str, lat: ArrayFloat32, lon: ArrayFloat32) -> None
+    Store a calculated latitude and longitude grid.
+"""
+
+import logging
+import os
+from contextlib import suppress
+from hashlib import blake2b
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+import netCDF4
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+from ..array import ArrayFloat32
+from ..netcdf.memo import CACHE_DIR_VARIABLE
+from .parameters import ProjectionParameters
+
+_logger = logging.getLogger(__name__)
+
+_CACHE_SUBDIR = "grids"
+
+_CHUNK_SIZE = 512
+
+# Blosc LZ4 with byte shuffling stores a full disk grid in a third of
+# its size and loads it about four times faster than it is calculated.
+# Without Blosc support in the netCDF library, grids are stored
+# uncompressed, zlib decompression is slower than the calculation.
+_COMPRESSION: dict[str, Any] = (
+    {"compression": "blosc_lz4", "blosc_shuffle": 1}
+    if getattr(netCDF4, "__has_blosc_support__", False)
+    else {}
+)
+
+
+def _get_cache_dir() -> Path | None:
+    # Return the directory of the cached grids, or None when caching is
+    # disabled, see memo._get_cache_path.
+    cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / _CACHE_SUBDIR
+
+
+def _get_grid_path(key: str) -> Path | None:
+    # Return the path of a cached grid, or None when caching is
+    # disabled.
+    cache_dir = _get_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / f"{key}.nc"
+
+
+def make_grid_key(
+    parameters: ProjectionParameters, algorithm: str
+) -> str | None:
+    """
+    Make the cache key of a calculated grid.
+
+    Parameters
+    ----------
+    parameters : ProjectionParameters
+        The projection parameters and fixed grid coordinates the grid
+        is calculated from.
+    algorithm : str
+        The name of the algorithm the grid is calculated with.
+
+    Returns
+    -------
+    str | None
+        The cache key, a digest of the grid inputs, or None when
+        caching is disabled.
+    """
+    if _get_cache_dir() is None:
+        return None
+
+    # Imported here, the package version is defined after the package
+    # imports this module.
+    from .. import __version__  # pylint: disable=import-outside-toplevel
+
+    digest = blake2b(digest_size=16)
+    header = (
+        __version__,
+        algorithm,
+        float(parameters.longitude_of_projection_origin),
+        float(parameters.perspective_point_height),
+        parameters.sweep_angle_axis,
+        float(parameters.semi_major_axis),
+        float(parameters.semi_minor_axis),
+        float(parameters.inverse_flattening),
+        parameters.x.size,
+        parameters.y.size,
+    )
+    digest.update(repr(header).encode())
+    # The coordinates themselves are part of the key, sectors such as
+    # the mesoscale ones move while keeping their shape.
+    digest.update(parameters.x.astype("<f8").tobytes())
+    digest.update(parameters.y.astype("<f8").tobytes())
+    return digest.hexdigest()
+
+
+def load_grid(key: str) -> tuple[ArrayFloat32, ArrayFloat32] | None:
+    """
+    Load a cached latitude and longitude grid.
+
+    Parameters
+    ----------
+    key : str
+        The cache key, see make_grid_key.
+
+    Returns
+    -------
+    tuple[ArrayFloat32, ArrayFloat32] | None
+        The latitude and longitude grid data, or None on a cache miss.
+    """
+    path = _get_grid_path(key)
+    if path is None or not path.is_file():
+        return None
+    try:
+        with Dataset(path) as record:
+            record.set_auto_mask(False)
+            lat: ArrayFloat32 = record.variables["latitude"][:]
+            lon: ArrayFloat32 = record.variables["longitude"][:]
+    except Exception:  # pylint: disable=broad-exception-caught
+        # A truncated or corrupt cached grid is a cache miss.
+        return None
+    return lat, lon
+
+
+def store_grid(key: str, lat: ArrayFloat32, lon: ArrayFloat32) -> None:
+    """
+    Store a calculated latitude and longitude grid.
+
+    The grid is written to a temporary file first and then moved into
+    place, so that concurrent readers never see a partial file. Caching
+    is best-effort, failures to write the grid, e.g. a cache directory
+    that is not writable, are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    key : str
+        The cache key, see make_grid_key.
+    lat : ArrayFloat32
+        The latitude grid data.
+    lon : ArrayFloat32
+        The longitude grid data.
+    """
+    path = _get_grid_path(key)
+    if path is None:
+        return
+    temporary_path: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as temporary:
+            temporary_path = temporary.name
+        _write_grid(temporary_path, lat, lon)
+        os.replace(temporary_path, path)
+        temporary_path = None
+    except (OSError, RuntimeError) as error:
+        # netCDF library errors are raised as RuntimeError.
+        _logger.warning("Cannot write the grid cache '%s': %s", path, error)
+    finally:
+        if temporary_path is not None:
+            with suppress(OSError):
+                os.unlink(temporary_path)
+
+
+def _write_grid(path: str, lat: ArrayFloat32, lon: ArrayFloat32) -> None:
+    # Write a latitude and longitude grid to a new netCDF file.
+    with Dataset(path, "w") as record:
+        record.createDimension("rows", lat.shape[0])
+        record.createDimension("columns", lat.shape[1])
+        chunks = (
+            min(_CHUNK_SIZE, max(1, lat.shape[0])),
+            min(_CHUNK_SIZE, max(1, lat.shape[1])),
+        )
+        for name, grid in (("latitude", lat), ("longitude", lon)):
+            variable_ = record.createVariable(
+                name,
+                "f4",
+                ("rows", "columns"),
+                chunksizes=chunks,
+                **_COMPRESSION,
+            )
+            variable_.set_auto_mask(False)
+            variable_[:] = grid
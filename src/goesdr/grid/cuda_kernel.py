@@ -0,0 +1,72 @@
+"""
+Provide the CUDA kernel of calculate_latlon_grid_cuda.
+
+This module requires the 'numba' package, it is imported by
+calculate_latlon_grid_cuda on first use.
+"""
+
+from math import atan, nan, pi, sqrt
+from typing import Any
+
+from numba import cuda
+
+# Degrees per radian, the factor applied by math.degrees.
+_RAD_TO_DEG = 180.0 / pi
+
+
+@cuda.jit  # type: ignore[misc]
+def latlon_kernel(
+    sin_x: Any,
+    cos_x: Any,
+    sin_y: Any,
+    cos_y: Any,
+    r_orb: float,
+    r_eq: float,
+    r_pol: float,
+    lambda_0: float,
+    lat: Any,
+    lon: Any,
+    mask: Any,
+) -> None:
+    """
+    Calculate the latitude and longitude of one pixel per thread.
+
+    Uses the same equations as numba_kernel._latlon_kernel. Pixels off
+    the Earth disk, where the discriminant is negative, are set to NaN
+    and flagged in the mask.
+    """
+    i, j = cuda.grid(2)  # pylint: disable=unbalanced-tuple-unpacking
+    if i >= sin_y.size or j >= sin_x.size:
+        return
+
+    ratio = (r_eq * r_eq) / (r_pol * r_pol)
+    c_var = (r_orb * r_orb) - (r_eq * r_eq)
+
+    sin_xj = sin_x[j]
+    cos_xj = cos_x[j]
+    sin_yi = sin_y[i]
+    cos_yi = cos_y[i]
+
+    a_var = sin_xj * sin_xj + cos_xj * cos_xj * (
+        cos_yi * cos_yi + ratio * sin_yi * sin_yi
+    )
+    b_var = -2.0 * r_orb * cos_xj * cos_yi
+    disc = b_var * b_var - 4.0 * a_var * c_var
+
+    if disc < 0.0:
+        lat[i, j] = nan
+        lon[i, j] = nan
+        mask[i, j] = True
+        return
+
+    r_s = (-b_var - sqrt(disc)) / (2.0 * a_var)
+
+    s_x = r_s * cos_xj * cos_yi
+    s_y = -r_s * sin_xj
+    s_z = r_s * cos_xj * sin_yi
+
+    r_xy = sqrt((r_orb - s_x) * (r_orb - s_x) + s_y * s_y)
+
+    lat[i, j] = _RAD_TO_DEG * atan(ratio * (s_z / r_xy))
+    lon[i, j] = _RAD_TO_DEG * atan(s_y / (s_x - r_orb)) + lambda_0
+    mask[i, j] = False
@@ -12,6 +12,9 @@ calculate_latlon_grid_cartopy
     Calculate latitude and longitude grids using the cartopy package.
 """
 
+from functools import lru_cache
+from typing import Any
+
 from numpy import float32, meshgrid
 
 from ..array import ArrayFloat32, ArrayFloat64
@@ -43,7 +46,7 @@ def calculate_latlon_grid_cartopy(
         A tuple containing the latitude and longitude grid data.
     """
     try:
-        import cartopy.crs as ccrs
+        import cartopy.crs  # noqa: F401  # pylint: disable=unused-import
     except ImportError as error:
         raise ImportError(
             "The 'cartopy' package is required for this functionality."
@@ -53,21 +56,14 @@ def calculate_latlon_grid_cartopy(
     y_m: ArrayFloat64
     x_m, y_m = meshgrid(projection_info.x_m, projection_info.y_m)
 
-    globe_geos = ccrs.Globe(
-        ellipse=None,
-        semimajor_axis=projection_info.semi_major_axis,
-        semiminor_axis=projection_info.semi_minor_axis,
+    geos_proj, plate_carree_proj = _make_projections(
+        float(projection_info.perspective_point_height),
+        float(projection_info.longitude_of_projection_origin),
+        projection_info.sweep_angle_axis,
+        float(projection_info.semi_major_axis),
+        float(projection_info.semi_minor_axis),
     )
 
-    geos_proj = ccrs.Geostationary(
-        satellite_height=projection_info.perspective_point_height,
-        central_longitude=projection_info.longitude_of_projection_origin,
-        sweep_axis=projection_info.sweep_angle_axis,
-        globe=globe_geos,
-    )
-
-    plate_carree_proj = ccrs.PlateCarree(globe=globe_geos)
-
     points = plate_carree_proj.transform_points(geos_proj, x_m, y_m)
 
     abi_lon: ArrayFloat64 = points[..., 0]
@@ -76,3 +72,30 @@ def calculate_latlon_grid_cartopy(
     abi_lon, abi_lat = make_consistent(abi_lon, abi_lat)
 
     return abi_lat.astype(float32), abi_lon.astype(float32)
+
+
+@lru_cache(maxsize=16)
+def _make_projections(
+    height: float, lon_0: float, sweep: str, r_eq: float, r_pol: float
+) -> tuple[Any, Any]:
+    # Build the geostationary and plate carrée projections once per set
+    # of parameters, the CRS setup dominates the cost of small grids
+    # and the parameters are shared by all the files of a satellite.
+    import cartopy.crs as ccrs
+
+    globe_geos = ccrs.Globe(
+        ellipse=None,
+        semimajor_axis=r_eq,
+        semiminor_axis=r_pol,
+    )
+
+    geos_proj = ccrs.Geostationary(
+        satellite_height=height,
+        central_longitude=lon_0,
+        sweep_axis=sweep,
+        globe=globe_geos,
+    )
+
+    plate_carree_proj = ccrs.PlateCarree(globe=globe_geos)
+
+    return geos_proj, plate_carree_proj
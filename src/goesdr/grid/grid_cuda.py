@@ -0,0 +1,118 @@
+"""
+Calculate latitude and longitude grids data on a CUDA GPU.
+
+Notes
+-----
+See GOES-R Product User Guide (PUG) Volume 5 (L2 products) Section 4.2.8
+for details & example of calculations.
+
+Functions
+---------
+calculate_latlon_grid_cuda
+    Calculate latitude and longitude grids on a CUDA GPU using Numba.
+"""
+
+from numpy import bool_, cos, empty, float32, sin
+
+from ..array import ArrayBool, ArrayFloat32
+from .parameters import ProjectionParameters
+
+# Threads per block of the kernel launch, along rows and columns.
+_THREADS = (16, 16)
+
+
+def calculate_latlon_grid_cuda(
+    projection_info: ProjectionParameters,
+    mask: ArrayBool | None = None,
+    out: tuple[ArrayFloat32, ArrayFloat32] | None = None,
+) -> tuple[ArrayFloat32, ArrayFloat32]:
+    """
+    Calculate latitude and longitude grids on a CUDA GPU using Numba.
+
+    Calculate latitude and longitude from GOES ABI fixed grid projection
+    data with the equations of calculate_latlon_grid_goesdr, one GPU
+    thread per pixel. GOES ABI fixed grid projection is a map projection
+    relative to the GOES satellite.
+
+    Units: latitude in °N (°S < 0), longitude in °E (°W < 0)
+
+    Parameters
+    ----------
+    projection_info : ProjectionParameters
+        Object containing the satellite's projection information and
+        GOES ABI fixed grid data.
+    mask : ArrayBool, optional
+        A boolean array of the shape of the grids; if given, it is set
+        to True for the pixels off the Earth disk, whose latitude and
+        longitude are NaN, and to False elsewhere.
+    out : tuple[ArrayFloat32, ArrayFloat32], optional
+        The latitude and longitude arrays, of the shape of the grids,
+        the grids are copied to. New arrays are allocated by default.
+
+    Returns
+    -------
+    tuple[ArrayFloat32, ArrayFloat32]
+        A tuple containing the latitude and longitude grid data.
+
+    Raises
+    ------
+    ImportError
+        If the 'numba' package is not installed.
+    RuntimeError
+        If no CUDA GPU is available.
+    """
+    try:
+        from numba import cuda
+    except ImportError as error:
+        raise ImportError(
+            "The 'numba' package is required for this functionality."
+        ) from error
+
+    if not cuda.is_available():
+        raise RuntimeError("No CUDA GPU is available.")
+
+    # The kernel module is imported, and the kernel compiled, only when
+    # a GPU calculation is requested.
+    from .cuda_kernel import latlon_kernel
+
+    x_r = projection_info.x
+    y_r = projection_info.y
+    shape = (y_r.size, x_r.size)
+
+    if out is None:
+        lat: ArrayFloat32 = empty(shape, dtype=float32)
+        lon: ArrayFloat32 = empty(shape, dtype=float32)
+    else:
+        lat, lon = out
+    if mask is None:
+        mask = empty(shape, dtype=bool_)
+
+    # Only the four 1-d factor vectors are sent to the device, the grids
+    # are calculated there and copied back once.
+    d_lat = cuda.device_array(shape, dtype=float32)
+    d_lon = cuda.device_array(shape, dtype=float32)
+    d_mask = cuda.device_array(shape, dtype=bool_)
+
+    blocks = (
+        (shape[0] + _THREADS[0] - 1) // _THREADS[0],
+        (shape[1] + _THREADS[1] - 1) // _THREADS[1],
+    )
+    latlon_kernel[blocks, _THREADS](
+        cuda.to_device(sin(x_r)),
+        cuda.to_device(cos(x_r)),
+        cuda.to_device(sin(y_r)),
+        cuda.to_device(cos(y_r)),
+        float(projection_info.orbital_radius),
+        float(projection_info.semi_major_axis),
+        float(projection_info.semi_minor_axis),
+        float(projection_info.longitude_of_projection_origin),
+        d_lat,
+        d_lon,
+        d_mask,
+    )
+
+    d_lat.copy_to_host(lat)
+    d_lon.copy_to_host(lon)
+    d_mask.copy_to_host(mask)
+
+    return lat, lon
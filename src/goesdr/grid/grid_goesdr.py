@@ -15,23 +15,30 @@ calculate_latlon_grid_goesdr
 
 from numpy import (
     arctan,
+    copyto,
     cos,
+    empty,
     float32,
     float64,
-    meshgrid,
-    power,
+    maximum,
+    nan,
+    newaxis,
     rad2deg,
     sin,
     sqrt,
 )
 
-from ..array import ArrayFloat32, ArrayFloat64
-from .helpers import make_common_mask
+from ..array import ArrayBool, ArrayFloat32, ArrayFloat64
 from .parameters import ProjectionParameters
 
+# Number of grid points processed at once by the NumPy implementation.
+_BLOCK_SIZE = 1 << 15
+
 
 def calculate_latlon_grid_goesdr(
     projection_info: ProjectionParameters,
+    mask: ArrayBool | None = None,
+    out: tuple[ArrayFloat32, ArrayFloat32] | None = None,
 ) -> tuple[ArrayFloat32, ArrayFloat32]:
     """
     Calculate latitude and longitude grids.
@@ -55,6 +62,14 @@ def calculate_latlon_grid_goesdr(
     projection_info : ProjectionParameters
         Object containing the satellite's projection information and
         GOES ABI fixed grid data.
+    mask : ArrayBool, optional
+        A boolean array of the shape of the grids; if given, it is set
+        to True for the pixels off the Earth disk, whose latitude and
+        longitude are NaN, and to False elsewhere, while the grids are
+        calculated.
+    out : tuple[ArrayFloat32, ArrayFloat32], optional
+        The latitude and longitude arrays, of the shape of the grids,
+        the grids are written to. New arrays are allocated by default.
 
     Returns
     -------
@@ -88,28 +103,51 @@ def calculate_latlon_grid_goesdr(
     x_r = projection_info.x
     y_r = projection_info.y
 
-    sin_x: ArrayFloat64 = sin(x_r)
-    cos_x: ArrayFloat64 = cos(x_r)
-    sin_y: ArrayFloat64 = sin(y_r)
-    cos_y: ArrayFloat64 = cos(y_r)
+    # The row and column factors are broadcast against each other
+    # instead of being expanded to full grids.
+    sin_x: ArrayFloat64 = sin(x_r)[newaxis, :]
+    cos_x: ArrayFloat64 = cos(x_r)[newaxis, :]
+    sin_y: ArrayFloat64 = sin(y_r)[:, newaxis]
+    cos_y: ArrayFloat64 = cos(y_r)[:, newaxis]
+
+    lat, lon = _make_grids((y_r.size, x_r.size), out)
+
+    # The grid is processed in blocks of rows, so that the temporary
+    # arrays of each block stay in cache and the peak memory does not
+    # grow with the grid size.
+    rows = max(1, _BLOCK_SIZE // max(1, x_r.size))
+    for start in range(0, y_r.size, rows):
+        block = slice(start, start + rows)
+        lat_block, lon_block, off_disk = _transform_grid(
+            (r_orb, r_eq, r_pol),
+            (sin_x, sin_y[block]),
+            (cos_x, cos_y[block]),
+        )
+        lat[block] = lat_block
+        lon[block] = lon_block + lambda_0
+        if mask is not None:
+            mask[block] = off_disk
 
-    sin_x, sin_y = meshgrid(sin_x, sin_y)
-    cos_x, cos_y = meshgrid(cos_x, cos_y)
+    return lat, lon
 
-    lat, lon = _transform_grid(
-        (r_orb, r_eq, r_pol),
-        (sin_x, sin_y),
-        (cos_x, cos_y),
-    )
 
-    return lat.astype(float32), (lon + lambda_0).astype(float32)
+def _make_grids(
+    shape: tuple[int, int], out: tuple[ArrayFloat32, ArrayFloat32] | None
+) -> tuple[ArrayFloat32, ArrayFloat32]:
+    # Return the latitude and longitude output arrays, the given ones or
+    # new ones.
+    if out is not None:
+        return out
+    lat: ArrayFloat32 = empty(shape, dtype=float32)
+    lon: ArrayFloat32 = empty(shape, dtype=float32)
+    return lat, lon
 
 
 def _transform_grid(
     params: tuple[float64, float64, float64],
     sin_xy: tuple[ArrayFloat64, ArrayFloat64],
     cos_xy: tuple[ArrayFloat64, ArrayFloat64],
-) -> tuple[ArrayFloat64, ArrayFloat64]:
+) -> tuple[ArrayFloat64, ArrayFloat64, ArrayBool]:
     """
     Calculate latitude and longitude grids.
 
@@ -128,8 +166,10 @@ def _transform_grid(
 
     Returns
     -------
-    tuple[ArrayFloat32, ArrayFloat32]
-        A tuple containing the latitude and longitude grid data.
+    tuple[ArrayFloat64, ArrayFloat64, ArrayBool]
+        A tuple containing the latitude and longitude grid data, and
+        the mask of the pixels off the Earth disk, whose latitude and
+        longitude are NaN.
 
     Notes
     -----
@@ -143,20 +183,27 @@ def _transform_grid(
     sin_x, sin_y = sin_xy
     cos_x, cos_y = cos_xy
 
+    # Squares are written as products, `power` with a float exponent
+    # is evaluated through `pow`.
+    ratio = (r_eq * r_eq) / (r_pol * r_pol)
+
     # Equations to calculate latitude and longitude
-    a_var = power(sin_x, 2.0) + (
-        power(cos_x, 2.0)
-        * (
-            power(cos_y, 2.0)
-            + (((r_eq * r_eq) / (r_pol * r_pol)) * power(sin_y, 2.0))
-        )
+    a_var = sin_x * sin_x + (
+        cos_x * cos_x * (cos_y * cos_y + ratio * (sin_y * sin_y))
     )
 
     b_var = -2.0 * r_orb * cos_x * cos_y
-    c_var = (r_orb**2.0) - (r_eq**2.0)
-    r_s = (-1.0 * b_var - sqrt((b_var**2) - (4.0 * a_var * c_var))) / (
-        2.0 * a_var
-    )
+    c_var = (r_orb * r_orb) - (r_eq * r_eq)
+
+    # The discriminant is negative for the pixels off the Earth disk;
+    # reference [2] states that this "occurs for GOES-16 ABI CONUS
+    # sector data", however it also occurs for Full Disk sector. It is
+    # clamped to zero, so that `sqrt` raises no invalid value error,
+    # and these pixels are set to NaN at the end.
+    disc = (b_var * b_var) - (4.0 * a_var * c_var)
+    off_disk: ArrayBool = disc < 0.0
+    maximum(disc, 0.0, out=disc)
+    r_s = (-1.0 * b_var - sqrt(disc)) / (2.0 * a_var)
 
     s_x = r_s * cos_x * cos_y
     s_y = -r_s * sin_x
@@ -164,12 +211,13 @@ def _transform_grid(
 
     abi_lat: ArrayFloat64 = rad2deg(
         arctan(
-            ((r_eq * r_eq) / (r_pol * r_pol))
+            ratio
             * (s_z / sqrt(((r_orb - s_x) * (r_orb - s_x)) + (s_y * s_y)))
         )
     )
     abi_lon: ArrayFloat64 = rad2deg(arctan(s_y / (s_x - r_orb)))
 
-    abi_lat, abi_lon = make_common_mask(abi_lat, abi_lon)
+    copyto(abi_lat, nan, where=off_disk)
+    copyto(abi_lon, nan, where=off_disk)
 
-    return abi_lat, abi_lon
+    return abi_lat, abi_lon, off_disk
@@ -0,0 +1,96 @@
+"""
+Calculate latitude and longitude grids data with a compiled kernel.
+
+Notes
+-----
+See GOES-R Product User Guide (PUG) Volume 5 (L2 products) Section 4.2.8
+for details & example of calculations.
+
+Functions
+---------
+calculate_latlon_grid_numba
+    Calculate latitude and longitude grids with a kernel compiled by
+    Numba.
+"""
+
+from numpy import bool_, cos, empty, float32, sin
+
+from ..array import ArrayBool, ArrayFloat32
+from .parameters import ProjectionParameters
+
+
+def calculate_latlon_grid_numba(
+    projection_info: ProjectionParameters,
+    mask: ArrayBool | None = None,
+    out: tuple[ArrayFloat32, ArrayFloat32] | None = None,
+) -> tuple[ArrayFloat32, ArrayFloat32]:
+    """
+    Calculate latitude and longitude grids with a kernel compiled by Numba.
+
+    Calculate latitude and longitude from GOES ABI fixed grid projection
+    data with the equations of calculate_latlon_grid_goesdr, pixel by
+    pixel, processing rows in parallel. The kernel is compiled on first
+    use and cached on disk. GOES ABI fixed grid projection is a map
+    projection relative to the GOES satellite.
+
+    Units: latitude in °N (°S < 0), longitude in °E (°W < 0)
+
+    Parameters
+    ----------
+    projection_info : ProjectionParameters
+        Object containing the satellite's projection information and
+        GOES ABI fixed grid data.
+    mask : ArrayBool, optional
+        A boolean array of the shape of the grids; if given, it is set
+        to True for the pixels off the Earth disk, whose latitude and
+        longitude are NaN, and to False elsewhere, while the grids are
+        calculated.
+    out : tuple[ArrayFloat32, ArrayFloat32], optional
+        The latitude and longitude arrays, of the shape of the grids,
+        the grids are written to. New arrays are allocated by default.
+
+    Returns
+    -------
+    tuple[ArrayFloat32, ArrayFloat32]
+        A tuple containing the latitude and longitude grid data.
+
+    Raises
+    ------
+    ImportError
+        If the 'numba' package is not installed.
+    """
+    try:
+        # The kernel module is imported, and Numba with it, only when a
+        # compiled calculation is requested.
+        from .numba_kernel import latlon_kernel
+    except ImportError as error:
+        raise ImportError(
+            "The 'numba' package is required for this functionality."
+        ) from error
+
+    x_r = projection_info.x
+    y_r = projection_info.y
+    shape = (y_r.size, x_r.size)
+
+    if out is None:
+        lat: ArrayFloat32 = empty(shape, dtype=float32)
+        lon: ArrayFloat32 = empty(shape, dtype=float32)
+    else:
+        lat, lon = out
+    if mask is None:
+        mask = empty(shape, dtype=bool_)
+
+    latlon_kernel(
+        (sin(x_r), cos(x_r), sin(y_r), cos(y_r)),
+        (
+            float(projection_info.orbital_radius),
+            float(projection_info.semi_major_axis),
+            float(projection_info.semi_minor_axis),
+            float(projection_info.longitude_of_projection_origin),
+        ),
+        lat,
+        lon,
+        mask,
+    )
+
+    return lat, lon
@@ -12,6 +12,9 @@ calculate_latlon_grid_pyproj
     Calculate latitude and longitude grids using the pyproj package.
 """
 
+from functools import lru_cache
+from typing import Any
+
 from numpy import float32, meshgrid
 
 from ..array import ArrayFloat32, ArrayFloat64
@@ -43,7 +46,7 @@ def calculate_latlon_grid_pyproj(
         A tuple containing the latitude and longitude grid data.
     """
     try:
-        from pyproj import Proj  # , Transformer
+        import pyproj  # noqa: F401  # pylint: disable=unused-import
     except ImportError as error:
         raise ImportError(
             "The 'pyproj' package is required for this functionality."
@@ -53,13 +56,12 @@ def calculate_latlon_grid_pyproj(
     y_m: ArrayFloat64
     x_m, y_m = meshgrid(projection_info.x_m, projection_info.y_m)
 
-    geos_proj = Proj(
-        proj="geos",
-        h=projection_info.perspective_point_height,
-        lon_0=projection_info.longitude_of_projection_origin,
-        sweep=projection_info.sweep_angle_axis,
-        a=projection_info.semi_major_axis,
-        b=projection_info.semi_minor_axis,
+    geos_proj = _make_geos_proj(
+        float(projection_info.perspective_point_height),
+        float(projection_info.longitude_of_projection_origin),
+        projection_info.sweep_angle_axis,
+        float(projection_info.semi_major_axis),
+        float(projection_info.semi_minor_axis),
     )
 
     abi_lon: ArrayFloat64
@@ -67,13 +69,25 @@ def calculate_latlon_grid_pyproj(
 
     abi_lon, abi_lat = geos_proj(x_m, y_m, inverse=True)
 
-    # The above is equivalent to the following:
-    #
-    # plate_carree_proj = Proj(proj="latlong", datum="WGS84")
-    # transformer = Transformer.from_proj(geos_proj, plate_carree_proj)
-    #
-    # abi_lon, abi_lat = transformer.transform(x_m, y_m)
-
     abi_lon, abi_lat = make_consistent(abi_lon, abi_lat)
 
     return abi_lat.astype(float32), abi_lon.astype(float32)
+
+
+@lru_cache(maxsize=16)
+def _make_geos_proj(
+    height: float, lon_0: float, sweep: str, r_eq: float, r_pol: float
+) -> Any:
+    # Build the geostationary projection once per set of parameters,
+    # the PROJ setup dominates the cost of small grids and the
+    # parameters are shared by all the files of a satellite.
+    from pyproj import Proj
+
+    return Proj(
+        proj="geos",
+        h=height,
+        lon_0=lon_0,
+        sweep=sweep,
+        a=r_eq,
+        b=r_pol,
+    )
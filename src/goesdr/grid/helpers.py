@@ -15,9 +15,11 @@ calculate_pixel_edges
 """
 
 from numpy import (
-    concatenate,
+    add,
+    empty,
     float64,
     isnan,
+    multiply,
     nan,
     where,
 )
@@ -114,7 +116,12 @@ def calculate_pixel_edges(centers: ArrayFloat64) -> ArrayFloat64:
     left_offset: float64 = 2 * centers[0] - centers[1]
     right_offset: float64 = 2 * centers[-1] - centers[-2]
 
-    left_centers = concatenate(([left_offset], centers))
-    right_centers = concatenate((centers, [right_offset]))
+    # The midpoints are written into the output array, instead of
+    # averaging two shifted copies of the centers.
+    edges: ArrayFloat64 = empty(centers.size + 1, dtype=float64)
+    add(centers[:-1], centers[1:], out=edges[1:-1])
+    multiply(edges[1:-1], 0.5, out=edges[1:-1])
+    edges[0] = 0.5 * (left_offset + centers[0])
+    edges[-1] = 0.5 * (centers[-1] + right_offset)
 
-    return 0.5 * (left_centers + right_centers)
+    return edges
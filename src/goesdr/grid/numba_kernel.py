@@ -0,0 +1,66 @@
+"""
+Provide the compiled kernel of calculate_latlon_grid_numba.
+
+This module requires the 'numba' package, it is imported by
+calculate_latlon_grid_numba on first use.
+"""
+
+from math import atan, degrees, nan, sqrt
+
+from numba import njit, prange
+
+from ..array import ArrayBool, ArrayFloat32, ArrayFloat64
+
+
+def _latlon_kernel(
+    sin_cos_xy: tuple[ArrayFloat64, ArrayFloat64, ArrayFloat64, ArrayFloat64],
+    params: tuple[float, float, float, float],
+    lat: ArrayFloat32,
+    lon: ArrayFloat32,
+    mask: ArrayBool,
+) -> None:
+    # Calculate latitude and longitude, pixel by pixel, with the same
+    # equations as grid_goesdr._transform_grid. Rows are processed in
+    # parallel and the intermediate values stay in registers instead of
+    # grid-sized temporary arrays. Pixels off the Earth disk, where the
+    # discriminant is negative, are set to NaN and flagged in the mask.
+    sin_x, cos_x, sin_y, cos_y = sin_cos_xy
+    r_orb, r_eq, r_pol, lambda_0 = params
+
+    ratio = (r_eq * r_eq) / (r_pol * r_pol)
+    c_var = (r_orb * r_orb) - (r_eq * r_eq)
+
+    for i in prange(sin_y.size):  # pylint: disable=not-an-iterable
+        sin_yi = sin_y[i]
+        cos_yi = cos_y[i]
+        cos_y2 = cos_yi * cos_yi + ratio * sin_yi * sin_yi
+        for j in range(sin_x.size):
+            sin_xj = sin_x[j]
+            cos_xj = cos_x[j]
+
+            a_var = sin_xj * sin_xj + cos_xj * cos_xj * cos_y2
+            b_var = -2.0 * r_orb * cos_xj * cos_yi
+            disc = b_var * b_var - 4.0 * a_var * c_var
+
+            if disc < 0.0:
+                lat[i, j] = nan
+                lon[i, j] = nan
+                mask[i, j] = True
+                continue
+
+            mask[i, j] = False
+
+            r_s = (-b_var - sqrt(disc)) / (2.0 * a_var)
+
+            s_x = r_s * cos_xj * cos_yi
+            s_y = -r_s * sin_xj
+            s_z = r_s * cos_xj * sin_yi
+
+            r_xy = sqrt((r_orb - s_x) * (r_orb - s_x) + s_y * s_y)
+
+            lat[i, j] = degrees(atan(ratio * (s_z / r_xy)))
+            lon[i, j] = degrees(atan(s_y / (s_x - r_orb))) + lambda_0
+
+
+# Compiled on first call and cached on disk.
+latlon_kernel = njit(parallel=True, cache=True)(_latlon_kernel)
@@ -27,6 +27,17 @@ class ProjectionParameters:
         The y-coordinate grid in radians.
     """
 
+    __slots__ = (
+        "longitude_of_projection_origin",
+        "perspective_point_height",
+        "sweep_angle_axis",
+        "semi_major_axis",
+        "semi_minor_axis",
+        "inverse_flattening",
+        "x",
+        "y",
+    )
+
     # Information about the projection
     longitude_of_projection_origin: float64
     perspective_point_height: float64
@@ -22,10 +22,13 @@ from .fields import (
     scalar,
     variable,
 )
+from .jit import jit
+from .memo import clear_cache
 from .view import DatasetView
 
 __all__ = [
     "attribute",
+    "clear_cache",
     "computed",
     "data",
     "DatasetView",
@@ -33,6 +36,7 @@ __all__ = [
     "field",
     "fields",
     "HasStrHelp",
+    "jit",
     "scalar",
     "variable",
 ]
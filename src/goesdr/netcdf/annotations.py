@@ -6,9 +6,38 @@ Functions
 get_annotations(object_instance: Any, root: type) -> dict[str, type]
     Extract all type annotations from an object instance up to a
     specified root class.
+get_class_annotations(cls: type, root: type) -> dict[str, type]
+    Extract all type annotations from a class up to a specified root
+    class.
 """
 
-from typing import Any
+from typing import Any, ClassVar, get_origin
+from weakref import WeakKeyDictionary
+
+# The merged annotations are a pure function of the instance class and
+# the root class, so they are computed once per class and reused. Weak
+# keys let dynamically created classes be collected normally.
+_annotations_cache: WeakKeyDictionary[type, dict[type, dict[str, type]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _collect_annotations(cls: type, root: type) -> dict[str, type]:
+    # Walk the class hierarchy in method resolution order and merge the
+    # annotations of every subclass of root, root itself excluded. Class
+    # variables are not instance attributes and are skipped.
+    all_attributes: dict[str, type] = {}
+    for base in cls.__mro__:
+        if not issubclass(base, root) or base is root:
+            continue
+        all_attributes |= {
+            key: value
+            for key, value in base.__annotations__.items()
+            if key not in all_attributes
+            and value is not ClassVar
+            and get_origin(value) is not ClassVar
+        }
+    return all_attributes
 
 
 def get_annotations(object_instance: Any, root: type) -> dict[str, type]:
@@ -20,6 +49,9 @@ def get_annotations(object_instance: Any, root: type) -> dict[str, type]:
     collected from the class hierarchy in the order of method
     resolution.
 
+    The result is cached per class and root class. Callers must not
+    modify the returned dictionary.
+
     Parameters
     ----------
     object_instance : Any
@@ -32,14 +64,33 @@ def get_annotations(object_instance: Any, root: type) -> dict[str, type]:
     dict[str, type]
         A dictionary of attribute names and their corresponding types.
     """
-    all_attributes: dict[str, type] = {}
-    mro_classes = object_instance.__class__.__mro__
-    for cls in mro_classes:
-        if not issubclass(cls, root) or cls is root:
-            continue
-        all_attributes |= {
-            key: value
-            for key, value in cls.__annotations__.items()
-            if key not in all_attributes
-        }
-    return all_attributes
+    return get_class_annotations(object_instance.__class__, root)
+
+
+def get_class_annotations(cls: type, root: type) -> dict[str, type]:
+    """
+    Extract type annotations from a class.
+
+    Extract all type annotations from a class up to, but not including,
+    a specified root class. The annotations are collected from the class
+    hierarchy in the order of method resolution.
+
+    The result is cached per class and root class. Callers must not
+    modify the returned dictionary.
+
+    Parameters
+    ----------
+    cls : type
+        A class.
+    root : type
+        The root class from which to extract annotations.
+
+    Returns
+    -------
+    dict[str, type]
+        A dictionary of attribute names and their corresponding types.
+    """
+    cached = _annotations_cache.setdefault(cls, {})
+    if root not in cached:
+        cached[root] = _collect_annotations(cls, root)
+    return cached[root]
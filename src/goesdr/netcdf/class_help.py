@@ -13,59 +13,103 @@ Functions:
         for readability.
 """
 
+from functools import lru_cache, singledispatch
+from inspect import getattr_static
 from typing import Any
+from weakref import WeakKeyDictionary
 
-from numpy import float32, ndarray
+from numpy import dtype, float32, ndarray
 from numpy.typing import NDArray
 
+from .annotations import get_class_annotations
+
+_properties_cache: WeakKeyDictionary[type, tuple[str, ...]] = (
+    WeakKeyDictionary()
+)
+
 
 def _get_attribute_names(this: Any, root: type) -> list[str]:
     # Retrieve a list of attribute names for a given instance and its
     # superclasses up to a specified root class.
     __dict__: dict[str, Any] = getattr(this, "__dict__", {})
     all_attributes: list[str] = list(__dict__.keys())
-    mro_classes: tuple[type, ...] = this.__class__.__mro__
-    for cls in mro_classes:
-        if not hasattr(cls, "__annotations__"):
-            continue
-        if issubclass(cls, root) and cls != root:
-            all_attributes.extend(
-                [
-                    key
-                    for key in cls.__annotations__.keys()
-                    if key not in all_attributes
-                ]
-            )
+    annotations = get_class_annotations(this.__class__, root)
+    all_attributes.extend(
+        [key for key in annotations if key not in __dict__]
+    )
     return all_attributes
 
 
+def _get_property_names(cls: type) -> tuple[str, ...]:
+    # Retrieve the names of the properties of a given class. The set of
+    # properties does not change at runtime, so the scan of 'dir(cls)'
+    # is done once per class.
+    names = _properties_cache.get(cls)
+    if names is None:
+        names = tuple(
+            name
+            for name in dir(cls)
+            if isinstance(getattr_static(cls, name, None), property)
+        )
+        _properties_cache[cls] = names
+    return names
+
+
 def _get_attribute_value(attribute_value: Any, root: type, indent: str) -> str:
     # Format the value of an attribute as a string, handling special
     # cases such as None, NumPy arrays, floats, strings, booleans, and
     # instances of the root class.
     if attribute_value is None:
         return "'not available'"
-    if isinstance(attribute_value, ndarray):
-        return _str_ndarray(attribute_value)
-    if isinstance(attribute_value, float):
-        return f"{attribute_value:.6f}"
-    if isinstance(attribute_value, str):
-        return f"'{attribute_value}'"
-    if isinstance(attribute_value, bool):
-        return f"{attribute_value}".lower()
-    if isinstance(attribute_value, root):
-        return help_str(attribute_value, root, f"{indent}    ")
+    return _format_value(attribute_value, root, indent)
+
+
+@singledispatch
+def _format_value(attribute_value: Any, root: type, indent: str) -> str:
+    # Format a value with no specialized handler. The handlers are
+    # dispatched on the value type, see the registrations below.
     return str(attribute_value)
 
 
+@_format_value.register
+def _(attribute_value: ndarray, root: type, indent: str) -> str:
+    return _str_ndarray(attribute_value)
+
+
+@_format_value.register
+def _(attribute_value: float, root: type, indent: str) -> str:
+    return f"{attribute_value:.6f}"
+
+
+@_format_value.register
+def _(attribute_value: str, root: type, indent: str) -> str:
+    return f"'{attribute_value}'"
+
+
+@_format_value.register
+def _(attribute_value: bool, root: type, indent: str) -> str:
+    return f"{attribute_value}".lower()
+
+
 def _str_ndarray(array: NDArray[float32]) -> str:
     # Generates a string representation of a NumPy array, including its
     # shape and data type. Returns a string representation of a NumPy
     # array, including its type, shape, and data type.
     shape: str = f"({array.size})" if array.ndim == 1 else f"{array.shape}"
-    dtype = f"{array.dtype}"
-    value = f"{type(array)}, shape={shape}, dtype={dtype}>"
-    return value.replace(">,", ",")
+    prefix, suffix = _str_ndarray_affixes(type(array), array.dtype)
+    return f"{prefix}{shape}{suffix}"
+
+
+@lru_cache(maxsize=None)
+def _str_ndarray_affixes(
+    array_type: type, array_dtype: dtype[Any]
+) -> tuple[str, str]:
+    # Formats, once per array type and data type, the parts of the
+    # string representation of a NumPy array that do not depend on its
+    # shape.
+    prefix = f"{array_type}, shape=".replace(">,", ",")
+    suffix = f", dtype={array_dtype}>"
+    return prefix, suffix
 
 
 def help_str(this: Any, root: type = object, indent: str = "    ") -> str:
@@ -90,21 +134,29 @@ def help_str(this: Any, root: type = object, indent: str = "    ") -> str:
     str
         A formatted string representation of the instance.
     """
-    attributes = [str(this.__class__)]
     all_attributes = _get_attribute_names(this, root)
-    for attribute_name in all_attributes:
-        attribute_value = getattr(this, attribute_name, None)
-        attribute_value = _get_attribute_value(attribute_value, root, indent)
-        attributes.append(f"{indent}{attribute_name}: {attribute_value}")
-    for attribute_name in dir(this.__class__):
-        attribute_value = getattr(this.__class__, attribute_name)
-        if isinstance(attribute_value, property):
-            attribute_value = getattr(this, attribute_name, None)
-            attribute_value = _get_attribute_value(
-                attribute_value, root, indent
-            )
-            attributes.append(f"{indent}{attribute_name}: {attribute_value}")
-    return "\n".join(attributes)
+    all_attributes.extend(_get_property_names(this.__class__))
+    values = [
+        _get_attribute_value(getattr(this, name, None), root, indent)
+        for name in all_attributes
+    ]
+    template = _help_str_template(indent, tuple(all_attributes))
+    return template.format(this.__class__, *values)
+
+
+@lru_cache(maxsize=256)
+def _help_str_template(indent: str, names: tuple[str, ...]) -> str:
+    # Build, once per indentation and attribute names, the template of
+    # the string representation of an instance. The class and the
+    # formatted attribute values are the template fields.
+    lines = [f"{indent}{name}: " for name in names]
+    lines = ["{}", *(_escape_braces(line) + "{}" for line in lines)]
+    return "\n".join(lines)
+
+
+def _escape_braces(text: str) -> str:
+    # Escape the replacement field delimiters of a format string.
+    return text.replace("{", "{{").replace("}", "}}")
 
 
 class HasStrHelp:
@@ -120,3 +172,12 @@ class HasStrHelp:
     def __str__(self) -> str:
         # Returns a representation of the object's class instance.
         return help_str(self, HasStrHelp)
+
+
+@_format_value.register
+def _(attribute_value: HasStrHelp, root: type, indent: str) -> str:
+    # Nested views are expanded in place only when they share the root
+    # class of the enclosing instance.
+    if isinstance(attribute_value, root):
+        return help_str(attribute_value, root, f"{indent}    ")
+    return str(attribute_value)
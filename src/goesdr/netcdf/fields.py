@@ -1,14 +1,75 @@
-from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Any
-
-from netCDF4 import Dataset  # pylint: disable=no-name-in-module
-from numpy import ndarray
+from sys import intern
+from typing import Any, cast
+from weakref import WeakKeyDictionary
+
+from netCDF4 import (  # pylint: disable=no-name-in-module
+    Dataset,
+    default_fillvals,
+)
+from numpy import False_, asarray, broadcast_to, ndarray
 from numpy.ma import MaskedArray
 
 ConvertFn = Callable[..., Any] | type
 FilterFn = Callable[..., Any]
 
+# Discriminators for the field placeholder classes. Dataset views
+# dispatch on identity of these tags rather than on isinstance checks.
+CLASS_FIELD = "class_field"
+VIEW_FIELD = "view_field"
+
+
+_ncattrs_cache: WeakKeyDictionary[Dataset, frozenset[str]] = (
+    WeakKeyDictionary()
+)
+
+
+def get_ncattrs(dataset: Dataset) -> frozenset[str]:
+    """
+    Return the names of the netCDF attributes of a dataset.
+
+    The names are listed once per dataset, so that attribute probes are
+    set lookups instead of failed attribute reads.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The netCDF dataset.
+
+    Returns
+    -------
+    frozenset[str]
+        The names of the netCDF attributes of the dataset.
+    """
+    ncattrs = _ncattrs_cache.get(dataset)
+    if ncattrs is None:
+        ncattrs = frozenset(dataset.ncattrs())
+        _ncattrs_cache[dataset] = ncattrs
+    return ncattrs
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Intern a string value, return any other value unchanged.
+
+    netCDF4 returns a new string on every attribute read, interning
+    keeps a single copy of the values repeated across the datasets of
+    a batch, e.g. 'institution' or 'platform_ID'.
+
+    Parameters
+    ----------
+    value : Any
+        The value to be interned.
+
+    Returns
+    -------
+    Any
+        The interned string, or the value itself if it is not a string.
+    """
+    if value.__class__ is str:
+        return intern(value)
+    return value
+
 
 class ClassField:
     """
@@ -19,6 +80,8 @@ class ClassField:
 
     Attributes
     ----------
+    field_kind : str
+        The field placeholder discriminator, always CLASS_FIELD.
     value : Any
         The value to be copied.
 
@@ -32,6 +95,9 @@ class ClassField:
         Abstract base class for dataset view field placeholders.
     """
 
+    __slots__ = ("value",)
+
+    field_kind: str = CLASS_FIELD
     value: Any
 
     def __init__(self, value: Any) -> None:
@@ -129,12 +195,14 @@ def field(value: Any) -> Any:
     return ClassField(value)
 
 
-class ViewField(ABC):
+class ViewField:
     """
     Abstract base class for dataset view field placeholders.
 
     Attributes
     ----------
+    field_kind : str
+        The field placeholder discriminator, always VIEW_FIELD.
     id : str | None
         The name of the field to be copied.
     entry : str | None
@@ -154,6 +222,9 @@ class ViewField(ABC):
         Represent a placeholder for dataset view variable fields.
     """
 
+    __slots__ = ("id", "entry", "convert")
+
+    field_kind: str = VIEW_FIELD
     id: str | None
     entry: str | None
     convert: ConvertFn
@@ -185,7 +256,6 @@ class ViewField(ABC):
 
         self.convert = convert or _identity
 
-    @abstractmethod
     def __call__(self, dataset: Dataset) -> Any:
         """
         Copy the field entry value from the dataset.
@@ -202,7 +272,15 @@ class ViewField(ABC):
         -------
         Any
             The field entry value copied from the dataset.
+
+        Raises
+        ------
+        NotImplementedError
+            If the subclass does not implement this method.
         """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement __call__"
+        )
 
     def set_entry(self, entry: str) -> None:
         """
@@ -241,6 +319,8 @@ class AttributeField(ViewField):
         Abstract base class for dataset view field placeholders.
     """
 
+    __slots__ = ()
+
     def __init__(self, entry: str | None, convert: ConvertFn | None) -> None:
         """
         Initialize the attribute field.
@@ -269,8 +349,15 @@ class AttributeField(ViewField):
         if self.entry is None:
             raise ValueError("Attribute name is required")
         try:
-            value_ = getattr(dataset, self.entry)
-            return self.convert(value_)
+            # Dataset properties, e.g. 'data_model', shadow the netCDF
+            # attributes of the same name, as with a plain getattr.
+            if self.entry in get_ncattrs(dataset) and not hasattr(
+                type(dataset), self.entry
+            ):
+                value_ = dataset.getncattr(self.entry)
+            else:
+                value_ = getattr(dataset, self.entry)
+            return intern_value(self.convert(value_))
         except AttributeError as error:
             raise ValueError(f"Unknown attribute '{self.entry}'") from error
 
@@ -346,6 +433,8 @@ class DimensionField(ViewField):
         Abstract base class for dataset view field placeholders.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, id: str | None, entry: str | None, convert: ConvertFn | None
     ) -> None:
@@ -372,12 +461,12 @@ class DimensionField(ViewField):
         return self._get_dimension(dataset, self.id, self.entry)
 
     def _get_dimension(self, dataset: Dataset, id: str, entry: str) -> Any:
+        dimensions = dataset.dimensions
+        if id not in dimensions:
+            raise ValueError(f"Unknown dimension '{id}'")
         try:
-            dimension_ = dataset.dimensions[id]
-            value_ = getattr(dimension_, entry)
+            value_ = getattr(dimensions[id], entry)
             return self.convert(value_)
-        except IndexError as error:
-            raise ValueError(f"Unknown dimension '{id}'") from error
         except AttributeError as error:
             raise ValueError(
                 f"Unknown dimension entry '{id}:{entry}'"
@@ -416,7 +505,9 @@ class DimensionProxy:
         Represent a placeholder for dataset view dimension fields.
     """
 
-    id: str | None = None
+    __slots__ = ("id",)
+
+    id: str | None
 
     def __init__(self, id: str | None) -> None:
         """
@@ -505,6 +596,87 @@ NODATA = "array:fill_value"
 MASK = "array:mask"
 
 
+def _full_mask(array: MaskedArray) -> Any:
+    # Return the mask of a masked array as an array of the same shape.
+    # Degenerate masks, i.e. 'nomask', a scalar False, or a full mask
+    # where no element is masked, are replaced by a read-only broadcast
+    # of False, which allocates no memory, and the full mask, if any,
+    # is released with the masked array.
+    mask = array.mask
+    if not mask.any():
+        return broadcast_to(False_, array.shape)
+    return mask
+
+
+def _select_array(array_value: Any) -> Any:
+    if not isinstance(array_value, ndarray):
+        raise TypeError("Unsuported variable entry type")
+    return array_value
+
+
+def _select_data(array_value: Any) -> Any:
+    # Plain arrays, read with auto-masking disabled, are the data.
+    if isinstance(array_value, MaskedArray):
+        return array_value.data
+    return _select_array(array_value)
+
+
+def _select_mask(array_value: Any) -> Any:
+    if isinstance(array_value, MaskedArray):
+        return _full_mask(array_value)
+    _select_array(array_value)
+    raise AttributeError("Unknown array entry")
+
+
+def _select_fill_value(array_value: Any) -> Any:
+    if isinstance(array_value, MaskedArray):
+        return array_value.fill_value
+    _select_array(array_value)
+    raise AttributeError("Unknown array entry")
+
+
+def _select_unknown(array_value: Any) -> Any:
+    _select_array(array_value)
+    raise AttributeError("Unknown array entry")
+
+
+def _extract_all(x: Any) -> Any:
+    # The default filter, a module-level function so that the array
+    # fields of a variable using it share their read, see share_key.
+    return x[:]
+
+
+def _get_fill_value(variable_: Any) -> Any:
+    # Return the fill value netCDF4 masks a variable with, from the
+    # variable attributes, without reading the variable. Note that an
+    # auto-masked read only carries it when some element is masked.
+    if not variable_.mask:
+        # Reads are plain arrays, which have no fill value.
+        raise AttributeError("Unknown array entry")
+    ncattrs = variable_.ncattrs()
+    if "_FillValue" in ncattrs:
+        value = variable_.getncattr("_FillValue")
+    elif "missing_value" in ncattrs:
+        value = variable_.getncattr("missing_value")
+    else:
+        value = default_fillvals[variable_.dtype.str[1:]]
+    dtype_ = variable_.dtype
+    fill_value = asarray(value, dtype=dtype_).reshape(-1)[0]
+    unsigned = "_Unsigned" in ncattrs and dtype_.kind == "i"
+    if unsigned and str(variable_.getncattr("_Unsigned")).lower() == "true":
+        fill_value = fill_value.view(f"u{dtype_.itemsize}")
+    return fill_value
+
+
+# Selectors of the array entries of a filtered variable array.
+_ARRAY_SELECTORS: dict[str, Callable[[Any], Any]] = {
+    ARRAY: _select_array,
+    DATA: _select_data,
+    MASK: _select_mask,
+    NODATA: _select_fill_value,
+}
+
+
 class VariableField(ViewField):
     """
     Represent a placeholder for dataset view variable fields.
@@ -533,7 +705,11 @@ class VariableField(ViewField):
         Abstract base class for dataset view field placeholders.
     """
 
+    __slots__ = ("filter", "_reader", "_selector")
+
     filter: FilterFn
+    _reader: Callable[[Any], Any] | None
+    _selector: Callable[[Any], Any]
 
     def __init__(
         self,
@@ -552,59 +728,181 @@ class VariableField(ViewField):
         entry : str | None
             The name of the variable entry to be copied.
         filter : FilterFn | None
-            The filter function to be applied to the variable entry.
+            The filter function to be applied to the variable entry,
+            default to reading the whole variable. Unfiltered fill
+            values are read from the variable attributes instead.
         convert : ConvertFn | None
             The conversion function to be applied to the
             variable entry value.
         """
         super().__init__(id, entry, convert)
 
-        def _extract_all(x: Any) -> Any:
-            return x[:]
-
         self.filter = filter or _extract_all
+        self._bind_reader()
 
     def __call__(self, dataset: Dataset) -> Any:
         if self.id is None:
             raise ValueError("Variable id is required")
-        if self.entry is None:
+        if self._reader is None:
             raise ValueError("Variable entry is required")
-        return self._get_variable(dataset, self.id, self.entry)
-
-    def _extract_array(self, variable_: Any, entry: str) -> Any:
-        array_value = self.filter(variable_)
-        if not isinstance(array_value, ndarray):
-            raise TypeError("Unsuported variable entry type")
-        if isinstance(array_value, MaskedArray):
-            if entry == DATA:
-                return array_value.data
-            if entry == MASK:
-                return array_value.mask
-            if entry == NODATA:
-                return array_value.fill_value
-        if entry == ARRAY:
-            return array_value
-        raise AttributeError("Unknown array entry")
+        variables = dataset.variables
+        if self.id not in variables:
+            raise ValueError(f"Unknown variable '{self.id}'")
+        try:
+            return self._reader(variables[self.id])
+        except AttributeError as error:
+            raise ValueError(
+                f"Unknown variable entry '{self.id}:{self.entry}'"
+            ) from error
+        except TypeError as error:
+            raise ValueError(
+                f"Unexpected variable entry type '{self.id}:{self.entry}'"
+            ) from error
+
+    def set_entry(self, entry: str) -> None:
+        """
+        Set the variable field entry name.
+
+        This method is used to set the field entry name when it is not
+        provided explicitly. It does not override the existing entry
+        name.
 
-    def _get_variable(self, dataset: Dataset, id: str, entry: str) -> Any:
+        Parameters
+        ----------
+        entry : str
+            The name of the variable entry to be copied.
+        """
+        super().set_entry(entry)
+        self._bind_reader()
+
+    def _bind_reader(self) -> None:
+        # Binds, once the entry is known, the reader and array selector
+        # of the entry, so that reads do not dispatch on the entry.
+        entry = self.entry
+        if entry is None:
+            self._reader = None
+        elif entry == DATA:
+            self._reader = self._read_data
+        elif self._reads_fill_value():
+            self._reader = self._read_fill_value
+        elif entry.startswith(ARRAY_PREFIX):
+            self._reader = self._read_array_entry
+        else:
+            self._reader = self._read_attribute
+        self._selector = _ARRAY_SELECTORS.get(entry or "", _select_unknown)
+
+    def _read_attribute(self, variable_: Any) -> Any:
+        value_ = getattr(variable_, cast(str, self.entry))
+        return intern_value(self.convert(value_))
+
+    def _read_array_entry(self, variable_: Any) -> Any:
+        return self.convert(self._selector(self.filter(variable_)))
+
+    def _read_fill_value(self, variable_: Any) -> Any:
+        return self.convert(_get_fill_value(variable_))
+
+    def _reads_fill_value(self) -> bool:
+        # Unfiltered fill values are read from the variable attributes.
+        return self.entry == NODATA and self.filter is _extract_all
+
+    def _read_data(self, variable_: Any) -> Any:
+        return self.convert(self._extract_data(variable_))
+
+    def _extract_data(self, variable_: Any) -> Any:
+        # With auto-masking disabled netCDF4 returns the data as a plain
+        # ndarray, skipping the mask synthesis and the masked array
+        # allocation. Values at would-be masked positions may differ,
+        # they are invalid data either way.
+        auto_mask = variable_.mask
+        variable_.set_auto_mask(False)
         try:
-            variable_ = dataset.variables[id]
-            if entry.startswith(ARRAY_PREFIX):
-                value_ = self._extract_array(variable_, entry)
-            else:
-                value_ = getattr(variable_, entry)
-            return self.convert(value_)
-        except IndexError as error:
-            raise ValueError(f"Unknown variable '{id}'") from error
+            array_value = self.filter(variable_)
+        finally:
+            variable_.set_auto_mask(auto_mask)
+        return _select_data(array_value)
+
+    def extract(self, array_value: Any) -> Any:
+        """
+        Extract the field entry value from a shared array read.
+
+        Parameters
+        ----------
+        array_value : Any
+            The array returned by 'read_array' for this field, or for
+            another array field of the same variable and filter.
+
+        Returns
+        -------
+        Any
+            The converted field entry value.
+
+        Raises
+        ------
+        ValueError
+            If the variable entry is unknown or of an unexpected type.
+        """
+        entry = cast(str, self.entry)
+        try:
+            return self.convert(self._selector(array_value))
         except AttributeError as error:
             raise ValueError(
-                f"Unknown variable entry '{id}:{entry}'"
+                f"Unknown variable entry '{self.id}:{entry}'"
             ) from error
         except TypeError as error:
             raise ValueError(
-                f"Unexpected variable entry type '{id}:{entry}'"
+                f"Unexpected variable entry type '{self.id}:{entry}'"
             ) from error
 
+    def read_array(self, dataset: Dataset) -> Any:
+        """
+        Read the filtered variable array from the dataset.
+
+        Dataset views read the array once for all their array fields of
+        the same variable and filter, and then 'extract' each entry from
+        it, see also 'share_key'.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to read the variable array from.
+
+        Returns
+        -------
+        Any
+            The filtered variable array, masked if auto-masking is
+            enabled on the variable.
+
+        Raises
+        ------
+        ValueError
+            If the variable is unknown.
+        """
+        if self.id is None:
+            raise ValueError("Variable id is required")
+        variables = dataset.variables
+        if self.id not in variables:
+            raise ValueError(f"Unknown variable '{self.id}'")
+        variable_ = variables[self.id]
+        return self.filter(variable_)
+
+    def share_key(self) -> tuple[str, FilterFn] | None:
+        """
+        Return the key under which array reads can be shared.
+
+        Returns
+        -------
+        tuple[str, FilterFn] | None
+            The variable name and filter function of an array field,
+            None if the field is not an array field or reads no array.
+        """
+        if self.id is None or self.entry is None:
+            return None
+        if not self.entry.startswith(ARRAY_PREFIX):
+            return None
+        if self._reads_fill_value():
+            return None
+        return self.id, self.filter
+
 
 class VariableProxy:
     """
@@ -623,6 +921,8 @@ class VariableProxy:
         Represent a placeholder for dataset view variable fields.
     """
 
+    __slots__ = ("id",)
+
     id: str
 
     def __init__(self, id: str) -> None:
@@ -850,6 +1150,8 @@ class DataField(VariableField):
         Abstract base class for dataset view field placeholders.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         id: str | None,
@@ -0,0 +1,57 @@
+"""
+Provide optional just-in-time compilation of conversion functions.
+
+Functions
+---------
+jit(function: Callable[..., Any]) -> Callable[..., Any]
+    Compile a field conversion function with Numba, if available.
+"""
+
+from collections.abc import Callable
+from types import FunctionType
+from typing import Any
+
+
+def jit(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Compile a field conversion function with Numba, if available.
+
+    Element-wise conversions of large arrays, e.g. unit rescaling, run
+    several times faster when compiled. The function is compiled in
+    nopython mode on its first call, and the compiled code is cached on
+    disk when the function is defined in a file. Other callables, e.g.
+    types, NumPy ufuncs or builtins, and any function when the 'numba'
+    package is not installed, are returned unchanged.
+
+    Parameters
+    ----------
+    function : Callable[..., Any]
+        The conversion function, it must be supported by Numba in
+        nopython mode.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The compiled function, or the function itself.
+
+    Examples
+    --------
+    >>> class Radiance(DatasetView):
+    ...     rad: ArrayFloat32 = variable("Rad").data(convert=jit(rescale))
+    """
+    if not isinstance(function, FunctionType):
+        return function
+
+    try:
+        from numba import njit  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return function
+
+    # Fast-math is not enabled, it assumes that there are no NaN values
+    # and these mark missing data in GOES products.
+    try:
+        return njit(cache=True)(function)  # type: ignore[no-any-return]
+    except RuntimeError:
+        # There is no cache locator for the function source, e.g. for
+        # functions defined interactively.
+        return njit(function)  # type: ignore[no-any-return]
@@ -0,0 +1,236 @@
+"""
+Provide persistent memoization of dataset view extraction results.
+
+Dataset views read their fields from netCDF datasets every time they
+are built, even for the same file. When the 'GOESDR_CACHE_DIR'
+environment variable names a directory, the attribute values of the
+views built from files on disk are stored there, keyed by the file path
+and modification time, the package version, the view class and its
+field plan, and subsequent constructions of the same view from the same
+file skip the reads.
+
+The field plan includes the code of the filter, conversion and
+__post_init__ functions of the view, editing them invalidates the
+stored values. Edits to other functions they call are not detected,
+clear the cache after such changes.
+
+Warnings
+--------
+The stored values are pickles, loaded back without any verification,
+and unpickling a tampered cache runs arbitrary code. Only point
+'GOESDR_CACHE_DIR' to a directory that no untrusted user can write to.
+The cache is not bounded in size, see clear_cache.
+
+Functions
+---------
+clear_cache() -> None
+    Remove all the memoized dataset view extraction results.
+"""
+
+import dbm
+import logging
+import marshal
+import os
+import pickle  # nosec B403
+import shelve  # nosec B403
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, cast
+
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+CACHE_DIR_VARIABLE = "GOESDR_CACHE_DIR"
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the layout of the stored values changes, stale entries are
+# then simply never looked up again.
+_CACHE_VERSION = 1
+_CACHE_FILE = "views"
+
+
+def _get_cache_path() -> Path | None:
+    # Return the path of the cache database, or None when memoization
+    # is disabled. The environment is read on every call so that the
+    # cache can be enabled or relocated at runtime.
+    cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / _CACHE_FILE
+
+
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def describe(value: Any) -> str | None:
+    """
+    Describe a field placeholder parameter for a cache key.
+
+    Plain values, i.e. None, numbers, strings, and bytes, are described
+    by their representation. Tuples are described by the descriptions
+    of their items. Classes are described by their qualified name.
+    Functions are described by their qualified name, a digest of their
+    code, and the descriptions of the values they capture in closures
+    and of their default argument values. Compiled functions, e.g.
+    Numba dispatchers, are described as the Python function they
+    compile.
+
+    Parameters
+    ----------
+    value : Any
+        A field placeholder parameter, e.g. a filter or a conversion
+        function.
+
+    Returns
+    -------
+    str | None
+        The description, or None when the value has no representation
+        that is stable across runs, views using it are not memoized.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return repr(value)
+    if isinstance(value, tuple):
+        items = [describe(item) for item in value]
+        if None in items:
+            return None
+        text = ", ".join(cast(list[str], items))
+        return f"({text},)" if len(items) == 1 else f"({text})"
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    # Compiled functions, e.g. Numba dispatchers, are described by the
+    # Python function they compile.
+    value = getattr(value, "py_func", value)
+    code = getattr(value, "__code__", None)
+    if code is None:
+        return None
+    try:
+        captured = tuple(
+            cell.cell_contents
+            for cell in getattr(value, "__closure__", None) or ()
+        )
+    except ValueError:
+        # An empty cell, the function captures an unbound name.
+        return None
+    defaults = getattr(value, "__defaults__", None)
+    kwdefaults = tuple(
+        sorted((getattr(value, "__kwdefaults__", None) or {}).items())
+    )
+    description = describe((captured, defaults, kwdefaults))
+    if description is None:
+        return None
+    # The marshalled code covers the bytecode, constants and names, and
+    # also line numbers, moving a function only costs cache misses.
+    digest = blake2b(marshal.dumps(code), digest_size=8).hexdigest()
+    qualname = f"{value.__module__}.{value.__qualname__}"
+    return f"{qualname}@{digest}{description}"
+
+
+def make_key(
+    record: Dataset, cls: type, signature: str | None
+) -> str | None:
+    """
+    Make the cache key of a dataset view.
+
+    Parameters
+    ----------
+    record : Dataset
+        The netCDF dataset the view is built from.
+    cls : type
+        The dataset view class.
+    signature : str | None
+        A representation of the field plan of the view class, None when
+        the view class cannot be memoized.
+
+    Returns
+    -------
+    str | None
+        The cache key, or None when memoization is disabled, the view
+        class cannot be memoized, or the dataset is not backed by a file
+        on disk.
+    """
+    if signature is None or _get_cache_path() is None:
+        return None
+    try:
+        path = os.path.realpath(record.filepath())
+        mtime = os.stat(path).st_mtime_ns
+    except (OSError, ValueError):
+        # In-memory and diskless datasets have no file to key on.
+        return None
+    # Imported here, the package version is defined after the package
+    # imports this module.
+    from .. import __version__  # pylint: disable=import-outside-toplevel
+
+    qualname = f"{cls.__module__}.{cls.__qualname__}"
+    return (
+        f"v{_CACHE_VERSION}:{__version__}:{path}:{mtime}:"
+        f"{qualname}:{signature}"
+    )
+
+
+def load(key: str) -> dict[str, Any] | None:
+    """
+    Load the memoized attribute values of a dataset view.
+
+    Parameters
+    ----------
+    key : str
+        The cache key, see make_key.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The attribute values, or None on a cache miss.
+    """
+    cache_path = _get_cache_path()
+    if cache_path is None:
+        return None
+    try:
+        with shelve.open(str(cache_path), flag="r") as cache:  # nosec B301
+            return cache.get(key)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # A missing, unreadable, or corrupt cache is a cache miss.
+        return None
+
+
+def store(key: str, values: dict[str, Any]) -> None:
+    """
+    Store the attribute values of a dataset view.
+
+    Values that cannot be pickled, e.g. instances of classes built at
+    runtime, are not memoized. Memoization is best-effort, failures to
+    write the cache, e.g. a cache directory that is not writable, are
+    logged and otherwise ignored.
+
+    Parameters
+    ----------
+    key : str
+        The cache key, see make_key.
+    values : dict[str, Any]
+        The attribute values of the dataset view.
+    """
+    cache_path = _get_cache_path()
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with shelve.open(str(cache_path)) as cache:  # nosec B301
+            try:
+                # Values are pickled before anything is written.
+                cache[key] = values
+            except (pickle.PicklingError, AttributeError, TypeError):
+                pass
+    except (OSError, *dbm.error) as error:
+        _logger.warning(
+            "Cannot write the view cache '%s': %s", cache_path, error
+        )
+
+
+def clear_cache() -> None:
+    """
+    Remove all the memoized dataset view extraction results.
+    """
+    cache_path = _get_cache_path()
+    if cache_path is None:
+        return
+    with shelve.open(str(cache_path), flag="n"):  # nosec B301
+        pass
@@ -6,42 +6,44 @@ handling for NumPy arrays and homogeneous collections.
 
 Functions
 ---------
-validate_value_type(value: Any, annotation: type) -> bool
+make_type_validator(annotation: type) -> Validator
+    Build a validator of values against a specified annotation.
+validate_type(value: Any, annotation: type) -> bool
     Validate the type of a given value against a specified annotation.
 """
 
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Any, Literal, cast, get_args, get_origin
 
 from numpy import dtype, ndarray
 
+Validator = Callable[[Any], bool]
+ShapeValidator = Callable[[tuple[int, ...]], bool]
 
-def _validate_ndarray_shape(
-    shape: tuple[int, ...], annotation: type | Any
-) -> bool:
-    # Validate the shape of a NumPy ndarray against an annotation.
-    origin = get_origin(annotation)
 
-    if not origin:
-        return annotation is Any
+def _always_valid(value: Any) -> bool:
+    # Accept any value.
+    return True
 
-    if not issubclass(origin, tuple):
-        return False
 
-    specs = get_args(annotation)
+def _never_valid(value: Any) -> bool:
+    # Reject any value.
+    return False
 
-    if specs == (int, ...):
-        return True
 
+def _make_shape_pattern(specs: tuple[Any, ...]) -> str | None:
+    # Build the regular expression matching the string representation
+    # of the shapes allowed by the shape annotation arguments, or None
+    # if no shape is allowed.
     pattern = ""
     for type_ in specs:
         if type_origin := get_origin(type_):
             if type_origin is not Literal:
-                return False
+                return None
             size = str(get_args(type_)[0])
             if not size.isdigit():
-                return False
+                return None
             lpattern = [f"[{c}]" for c in size]
             pattern += f"{''.join(lpattern)},"
         elif type_ is Ellipsis:
@@ -49,25 +51,45 @@ def _validate_ndarray_shape(
         elif issubclass(type_, int):
             pattern += r"\d+,"
         else:
-            return False
+            return None
+    return pattern.strip(",")
+
+
+def _make_ndarray_shape_validator(annotation: type | Any) -> ShapeValidator:
+    # Build a validator of NumPy ndarray shapes against an annotation.
+    origin = get_origin(annotation)
+
+    if not origin:
+        return _always_valid if annotation is Any else _never_valid
+
+    if not issubclass(origin, tuple):
+        return _never_valid
+
+    specs = get_args(annotation)
+
+    if specs == (int, ...):
+        return _always_valid
+
+    pattern = _make_shape_pattern(specs)
 
-    pattern = pattern.strip(",")
-    shape_string = str(shape).strip("(,)").replace(" ", "")
+    if pattern is None:
+        return _never_valid
 
-    print(pattern, shape_string)
+    compiled = re.compile(pattern)
 
-    return bool(re.fullmatch(pattern, shape_string))
+    def _validate_shape(shape: tuple[int, ...]) -> bool:
+        shape_string = str(shape).strip("(,)").replace(" ", "")
+        return bool(compiled.fullmatch(shape_string))
 
+    return _validate_shape
 
-def _validate_ndarray(value: Any, annotation: type) -> bool:
-    # Validate a NumPy ndarray against a specified annotation.
+
+def _make_ndarray_validator(annotation: type) -> Validator:
+    # Build a validator of NumPy ndarrays against a specified annotation.
 
     # NOTE: We only expect arrays with scalar numeric content
     # in our project!
 
-    if not isinstance(value, ndarray):
-        return False
-
     # NOTE: According to NumPy's documentation, as of version
     # 2.1.0, the correct way to annotate an 'ndarray' is:
     #
@@ -87,45 +109,51 @@ def _validate_ndarray(value: Any, annotation: type) -> bool:
     # to be valid shape type hinting. 'Any' can be used for
     # typing arrays with a given 'dtype' and unspecified shape.
 
-    if dtype[value.dtype] != get_args(annotation)[1]:
-        return False
+    # The origin is 'ndarray' or a subclass of it, e.g. 'MaskedArray'.
+    origin = cast(type, get_origin(annotation))
+    shape_annotation, dtype_annotation = get_args(annotation)
 
-    return _validate_ndarray_shape(value.shape, get_args(annotation)[0])
+    if get_origin(dtype_annotation) is not dtype:
+        return _never_valid
 
+    validate_dtype = _make_dtype_validator(get_args(dtype_annotation))
+    validate_shape = _make_ndarray_shape_validator(shape_annotation)
 
-def validate_type(value: Any, annotation: type) -> bool:
-    """
-    Validate the type of a given value against a specified annotation.
+    def _validate_ndarray(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        if not validate_dtype(value.dtype):
+            return False
+        return validate_shape(value.shape)
 
-    Validate the type of a given value against a specified annotation,
-    including special handling for NumPy arrays and homogeneous
-    collections.
+    return _validate_ndarray
 
-    Parameters
-    ----------
-    value : Any
-        The value to be validated.
-    annotation : type
-        The annotation to be validated against.
 
-    Returns
-    -------
-    bool
-        True if the value matches the annotation, False otherwise.
-    """
-    if isinstance(annotation, type(Any)):
-        return True
+def _make_dtype_validator(dtype_args: tuple[Any, ...]) -> Validator:
+    # Build a validator of NumPy data types against the arguments of a
+    # 'dtype[scalar_type]' annotation. For concrete scalar types the
+    # check reduces to an identity test on the data type scalar type.
+    if len(dtype_args) == 1 and isinstance(dtype_args[0], type):
+        scalar_type = dtype_args[0]
+        try:
+            concrete = dtype(scalar_type).type is scalar_type
+        except TypeError:
+            concrete = False
+        if concrete:
 
-    origin: type | None = get_origin(annotation)
+            def _validate_scalar_type(value_dtype: Any) -> bool:
+                return value_dtype.type is scalar_type
 
-    if not origin:
-        return isinstance(value, annotation)
+            return _validate_scalar_type
+
+    def _validate_dtype(value_dtype: Any) -> bool:
+        return (value_dtype,) == dtype_args
+
+    return _validate_dtype
 
-    if not isinstance(value, origin):
-        return False
 
-    if isinstance(value, ndarray):
-        return _validate_ndarray(value, annotation)
+def _make_collection_validator(origin: type, annotation: type) -> Validator:
+    # Build a validator of collections against a specified annotation.
 
     # NOTE: We only expect collections containing only
     # homogeneous scalar content in our project!
@@ -143,10 +171,88 @@ def validate_type(value: Any, annotation: type) -> bool:
 
     arguments: tuple[type, ...] = get_args(annotation)
 
-    if len(arguments) > 1 or get_origin(arguments[0]):
-        return False
+    if len(arguments) != 1 or get_origin(arguments[0]):
+        return _never_valid
+
+    item_type = arguments[0]
+
+    def _validate_collection(value: Any) -> bool:
+        if not isinstance(value, origin):
+            return False
+        # We know it is an iterable, so we can cast it.
+        value = cast(Iterable[Any], value)
+        return all(isinstance(item, item_type) for item in value)
+
+    return _validate_collection
+
+
+def _make_instance_validator(annotation: type) -> Validator:
+    # Build a validator of instances of a class.
+
+    def _validate_instance(value: Any) -> bool:
+        return isinstance(value, annotation)
+
+    return _validate_instance
+
+
+def make_type_validator(annotation: type) -> Validator:
+    """
+    Build a validator of values against a specified annotation.
+
+    The annotation is analysed once, the returned validator only
+    performs the checks that depend on the value. Include special
+    handling for NumPy arrays and homogeneous collections.
+
+    Parameters
+    ----------
+    annotation : type
+        The annotation to be validated against.
+
+    Returns
+    -------
+    Validator
+        A function returning True if the value matches the annotation,
+        False otherwise.
+    """
+    # Concrete non-generic classes are the common case, they need
+    # neither 'Any' nor origin handling.
+    if annotation.__class__ is type:
+        return _make_instance_validator(annotation)
+
+    if isinstance(annotation, type(Any)):
+        return _always_valid
+
+    origin: type | None = get_origin(annotation)
+
+    if not origin:
+        return _make_instance_validator(annotation)
+
+    if isinstance(origin, type) and issubclass(origin, ndarray):
+        return _make_ndarray_validator(annotation)
+
+    return _make_collection_validator(origin, annotation)
+
+
+def validate_type(value: Any, annotation: type) -> bool:
+    """
+    Validate the type of a given value against a specified annotation.
+
+    Validate the type of a given value against a specified annotation,
+    including special handling for NumPy arrays and homogeneous
+    collections.
 
-    # We know it is an iterable, so we can cast it.
-    value = cast(Iterable[Any], value)
+    Parameters
+    ----------
+    value : Any
+        The value to be validated.
+    annotation : type
+        The annotation to be validated against.
 
-    return all(isinstance(item, arguments[0]) for item in value)
+    Returns
+    -------
+    bool
+        True if the value matches the annotation, False otherwise.
+    """
+    if annotation.__class__ is type:
+        return isinstance(value, annotation)
+    return make_type_validator(annotation)(value)
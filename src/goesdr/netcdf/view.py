@@ -12,16 +12,186 @@ DataFragment
     Represents a data record extracted from a netCDF dataset.
 """
 
-from inspect import currentframe, getmodule
-from typing import Any, NoReturn, TypeVar, cast
+from collections import Counter
+from collections.abc import Callable
+from inspect import getmodule
+from typing import Any, ClassVar, NamedTuple, NoReturn, TypeVar, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from netCDF4 import Dataset  # pylint: disable=no-name-in-module
 
-from .annotations import get_annotations
+from . import memo
+from .annotations import get_class_annotations
 from .class_help import HasStrHelp, help_str
-from .fields import ClassField, ViewField
+from .fields import (
+    CLASS_FIELD,
+    VIEW_FIELD,
+    VariableField,
+    get_ncattrs,
+    intern_value,
+)
 from .hinting import get_annotated, get_typehint
-from .validation import validate_type
+from .validation import Validator, make_type_validator
+
+# Sentinel for attribute probes, distinguishes a missing attribute from
+# an attribute whose value is None.
+_MISSING = object()
+
+# Identifiers of the instances whose __post_init__ is running, the only
+# instances that accept attribute assignment. Kept out of the instances
+# so that their __dict__ only holds the annotated attributes.
+_in_post_init: set[int] = set()
+
+# Discriminators for attributes that are not field placeholders, see
+# CLASS_FIELD and VIEW_FIELD for the field placeholder ones.
+_CLASS_ATTRIBUTE = "class_attribute"
+_RECORD_ATTRIBUTE = "record_attribute"
+_PROBED_KINDS = (_CLASS_ATTRIBUTE, _RECORD_ATTRIBUTE)
+
+
+class _FieldSpec(NamedTuple):
+    # Precomputed initialization and validation data of an annotated
+    # attribute of a DatasetView subclass.
+    name: str
+    kind: str
+    value: Any
+    annotation: type
+    atype: str
+    validate: Validator
+
+
+def _make_field_plan(cls: type) -> tuple[_FieldSpec, ...]:
+    # Resolve, once per class, where each annotated attribute takes its
+    # value from, and preformat its type hint for error messages.
+    plan: list[_FieldSpec] = []
+    annotations = get_class_annotations(cls, DatasetView)
+    for name, annotation in annotations.items():
+        value = getattr(cls, name, _MISSING)
+        kind = getattr(type(value), "field_kind", None)
+        if value is _MISSING:
+            kind = _RECORD_ATTRIBUTE
+        elif kind is VIEW_FIELD:
+            value.set_entry(name)
+        elif kind is CLASS_FIELD:
+            value = value.value
+        else:
+            kind = _CLASS_ATTRIBUTE
+        atype = get_annotated(annotation)
+        validate = make_type_validator(annotation)
+        plan.append(
+            _FieldSpec(name, kind, value, annotation, atype, validate)
+        )
+    return tuple(plan)
+
+
+def _make_plan_signature(
+    plan: tuple[_FieldSpec, ...], post_init: Callable[..., Any]
+) -> str | None:
+    # Represent where each attribute of a field plan takes its value
+    # from, and the __post_init__ of the view, it is part of the key of
+    # memoized extraction results. View fields are described by their
+    # parameters, class attributes by their value, None when any of them
+    # has no stable representation.
+    post_init_description = memo.describe(post_init)
+    if post_init_description is None:
+        return None
+    items: list[str] = [f"__post_init__={post_init_description}"]
+    for spec in plan:
+        if spec.kind is VIEW_FIELD:
+            parameters = tuple(
+                getattr(spec.value, slot, None)
+                for slot in ("id", "entry", "filter", "convert")
+            )
+        elif spec.kind is _RECORD_ATTRIBUTE:
+            parameters = ()
+        else:
+            parameters = (spec.value,)
+        description = memo.describe((spec.kind, *parameters))
+        if description is None:
+            return None
+        items.append(f"{spec.name}={description}")
+    return ";".join(items)
+
+
+def _is_shareable(spec: _FieldSpec) -> bool:
+    # Tell whether a field may share its array read with other fields.
+    return spec.kind is VIEW_FIELD and isinstance(spec.value, VariableField)
+
+
+def _make_init_attributes(
+    plan: tuple[_FieldSpec, ...],
+) -> Callable[[Any, Dataset], None]:
+    # Generate an attribute initializer specialized for a field plan.
+    # Class attributes are copied to the instance, field attributes are
+    # extracted from the dataset, and the remaining attributes are
+    # copied from the record attributes of the same name. The generated
+    # code unrolls the loop over the plan, so there is neither iteration
+    # nor dispatch on the attribute kind at construction time. Array
+    # fields of the same variable and filter share a single read.
+    share_keys = [
+        spec.value.share_key() if _is_shareable(spec) else None
+        for spec in plan
+    ]
+    share_counts = Counter(key for key in share_keys if key is not None)
+    shared_reads: dict[Any, str] = {}
+    namespace: dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_get_ncattrs": get_ncattrs,
+        "_intern": intern_value,
+    }
+    lines = ["def _init_attributes(self, record):"]
+    # Attribute names are probed against the netCDF attribute names and
+    # against the record type, whose properties, e.g. 'data_model',
+    # shadow the netCDF attributes of the same name as with getattr.
+    if any(spec.kind in _PROBED_KINDS for spec in plan):
+        lines.append("    ncattrs = _get_ncattrs(record)")
+        lines.append("    rtype = type(record)")
+    items: list[str] = []
+    for index, (name, kind, value, _, atype, _) in enumerate(plan):
+        local_id = f"value_{index}"
+        value_id = f"_value_{index}"
+        error_id = f"_error_{index}"
+        namespace[value_id] = value
+        items.append(f"{name!r}: {local_id}")
+        if kind is _RECORD_ATTRIBUTE:
+            namespace[error_id] = f"Attribute '{name}: {atype}' is undefined"
+            probe = f"{name!r} in ncattrs and not hasattr(rtype, {name!r})"
+            lines.append(f"    if {probe}:")
+            lines.append(f"        {local_id} = record.getncattr({name!r})")
+            lines.append("    else:")
+            lines.append(
+                f"        {local_id} = getattr(record, {name!r}, _MISSING)"
+            )
+            lines.append(f"        if {local_id} is _MISSING:")
+            lines.append(f"            raise AttributeError({error_id})")
+            lines.append(f"    {local_id} = _intern({local_id})")
+        elif kind is VIEW_FIELD and share_counts[share_keys[index]] > 1:
+            array_id = shared_reads.get(share_keys[index])
+            if array_id is None:
+                array_id = f"array_{len(shared_reads)}"
+                shared_reads[share_keys[index]] = array_id
+                lines.append(f"    {array_id} = {value_id}.read_array(record)")
+            lines.append(f"    {local_id} = {value_id}.extract({array_id})")
+        elif kind is VIEW_FIELD:
+            lines.append(f"    {local_id} = {value_id}(record)")
+        elif kind is CLASS_FIELD:
+            lines.append(f"    {local_id} = {value_id}")
+        else:
+            # This is a name clash, rename the attribute or explicitly
+            # make it a class field (ClassField).
+            namespace[error_id] = (
+                f"Attribute '{name}: {atype}' "
+                "collides with record attribute of the same name"
+            )
+            probe = f"{name!r} in ncattrs or hasattr(rtype, {name!r})"
+            lines.append(f"    if {probe}:")
+            lines.append(f"        raise AttributeError({error_id})")
+            lines.append(f"    {local_id} = {value_id}")
+    # All values are stored at once, bypassing the guarded __setattr__
+    # of the instance.
+    lines.append(f"    self.__dict__.update({{{', '.join(items)}}})")
+    exec("\n".join(lines), namespace)  # nosec B102
+    return cast(Callable[[Any, Dataset], None], namespace["_init_attributes"])
 
 
 class DatasetView(HasStrHelp):
@@ -31,8 +201,39 @@ class DatasetView(HasStrHelp):
     Attributes are dynamically set based on the annotations and field
     specifications defined in the class and the corresponding records
     present in the provided netCDF dataset.
+
+    The field plan of each subclass is computed when the subclass is
+    created, annotations and fields must be defined in the class body.
+
+    When the 'GOESDR_CACHE_DIR' environment variable is set, the
+    attribute values of views built from files on disk are memoized
+    there, see the memo module.
+
+    Attributes
+    ----------
+    validate_types : bool
+        Whether the attribute values are checked against their type
+        annotations after initialization. Enabled by default, disabled
+        when Python runs with optimizations ('-O'). Subclasses can set
+        it to False to skip the checks.
     """
 
+    validate_types: ClassVar[bool] = __debug__
+
+    _field_plan: ClassVar[tuple[_FieldSpec, ...]] = ()
+    _plan_signature: ClassVar[str | None] = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Precomputes the field plan of the subclass.
+        super().__init_subclass__(**kwargs)
+        cls._field_plan = _make_field_plan(cls)
+        cls._plan_signature = _make_plan_signature(
+            cls._field_plan, cls.__post_init__
+        )
+        setattr(
+            cls, "_init_attributes", _make_init_attributes(cls._field_plan)
+        )
+
     def __init__(self, record: Dataset) -> None:
         """
         Initialize the DataFragment object.
@@ -46,11 +247,18 @@ class DatasetView(HasStrHelp):
             The netCDF dataset containing the data to be extracted.
         """
         self._validate_preconditions()
-        self._init_class_attributes(record)
-        self._init_record_attributes(record)
-        self._init_field_attributes(record)
+        key = memo.make_key(record, self.__class__, self._plan_signature)
+        if key is not None:
+            values = memo.load(key)
+            if values is not None:
+                self.__dict__.update(values)
+                return
+        self._init_attributes(record)
         self._perform_post_init_setup(record)
-        self._validate_postconditions()
+        if self.validate_types:
+            self._validate_postconditions()
+        if key is not None:
+            memo.store(key, self.__dict__)
 
     def __post_init__(self, record: Dataset) -> None:
         """
@@ -62,7 +270,12 @@ class DatasetView(HasStrHelp):
         """
 
     def _perform_post_init_setup(self, record: Dataset) -> None:
-        self.__post_init__(record)
+        # Unfreezes the instance while __post_init__ runs.
+        _in_post_init.add(id(self))
+        try:
+            self.__post_init__(record)
+        finally:
+            _in_post_init.discard(id(self))
 
     def __delattr__(self, name: str) -> NoReturn:
         # Prevents deletion of attributes.
@@ -74,70 +287,19 @@ class DatasetView(HasStrHelp):
         # object.__setattr__, but the goal is to prevent accidental
         # assignment of attributes to the instance not to guarantee
         # immutability.
-        current = currentframe()
-        frame = current.f_back if current else None
-        while frame:
-            if (
-                frame.f_code.co_name == "__post_init__"
-                and frame.f_locals.get("self") is self
-            ):
-                object.__setattr__(self, name, value)
-                return
-            frame = frame.f_back
-        raise AttributeError(f"Cannot set attribute '{name}'")
+        if id(self) not in _in_post_init:
+            raise AttributeError(f"Cannot set attribute '{name}'")
+        object.__setattr__(self, name, value)
 
     def __str__(self) -> str:
         # Returns a string representation of the DataFragment object.
         return help_str(self, DatasetView)
 
-    def _init_class_attributes(self, record: Dataset) -> None:
-        # Initializes class attributes from the provided dataset. Copy
-        # class attributes to the instance provided they are not field
-        # attributes.
-        annotations = get_annotations(self, DatasetView)
-        for name, annotation in annotations.items():
-            if hasattr(self, name):
-                value = getattr(self, name)
-                if isinstance(value, ViewField):
-                    continue
-                if isinstance(value, ClassField):
-                    value = value.value
-                elif hasattr(record, name):
-                    # This is a name clash, rename the attribute or
-                    # explicitly make it a class field (ClassField).
-                    atype = get_annotated(annotation)
-                    raise AttributeError(
-                        f"Attribute '{name}: {atype}' "
-                        "collides with record attribute of the same name"
-                    )
-                object.__setattr__(self, name, value)
-
-    def _init_record_attributes(self, record: Dataset) -> None:
-        # Initializes record attributes from the provided dataset. Copy
-        # record attributes to the instance.
-        annotations = get_annotations(self, DatasetView)
-        for name, annotation in annotations.items():
-            if hasattr(self, name):
-                continue
-            if not hasattr(record, name):
-                atype = get_annotated(annotation)
-                raise AttributeError(
-                    f"Attribute '{name}: {atype}' is undefined"
-                )
-            value = getattr(record, name)
-            object.__setattr__(self, name, value)
-
-    def _init_field_attributes(self, record: Dataset) -> None:
-        # Initializes field attributes from the provided dataset. Copy
-        # record field attributes to the instance, convert the data if
-        # necessary.
-        for name in get_annotations(self, DatasetView):
-            value = getattr(self, name)
-            if not isinstance(value, ViewField):
-                continue
-            value.set_entry(name)
-            extracted_value = value(record)
-            object.__setattr__(self, name, extracted_value)
+    def _init_attributes(self, record: Dataset) -> None:
+        # Initializes all annotated attributes. Subclasses replace this
+        # method with one specialized for their field plan, see
+        # _make_init_attributes.
+        pass
 
     def _validate_preconditions(self) -> None:
         # Validates preconditions before initialization.
@@ -146,13 +308,11 @@ class DatasetView(HasStrHelp):
 
     def _validate_postconditions(self) -> None:
         # Validates postconditions after initialization.
-        all_annotations = get_annotations(self, DatasetView)
-        for name, annotation in all_annotations.items():
+        for name, _, _, _, atype, validate in self._field_plan:
             value = getattr(self, name)
-            if validate_type(value, annotation):
+            if validate(value):
                 continue
             vtype = get_typehint(value)
-            atype = get_annotated(annotation)
             raise TypeError(
                 f"Attribute '{name}: {atype}' "
                 f"does not match the given type '{vtype}'"
@@ -161,26 +321,42 @@ class DatasetView(HasStrHelp):
 
 _T = TypeVar("_T")
 
+# Dataset views generated by netcdf_fragment, keyed by the decorated
+# class, and the set of the generated views, so that decorating a class
+# again, or the view class that replaced it in its module, is a no-op.
+_fragment_cache: WeakKeyDictionary[type, type] = WeakKeyDictionary()
+_fragment_classes: WeakSet[type] = WeakSet()
+
 
 def netcdf_fragment(recordclass: type[_T]) -> type[_T]:
-    class _FragmentRecord(DatasetView):
-        pass
+    if recordclass in _fragment_classes:
+        return recordclass
+    cached = _fragment_cache.get(recordclass)
+    if cached is not None:
+        return cast(type[_T], cached)
 
-    _FragmentRecord.__annotations__ = recordclass.__annotations__.copy()
-    _FragmentRecord.__module__ = recordclass.__module__
-    _FragmentRecord.__name__ = recordclass.__name__
-    _FragmentRecord.__qualname__ = recordclass.__qualname__
+    # Build the namespace up front so the field plan of the generated
+    # class sees every annotation and field at class creation time.
+    namespace: dict[str, Any] = {
+        "__annotations__": recordclass.__annotations__.copy(),
+        "__module__": recordclass.__module__,
+        "__qualname__": recordclass.__qualname__,
+    }
 
     for name in recordclass.__annotations__:
         if hasattr(recordclass, name):
-            value = getattr(recordclass, name)
-            setattr(_FragmentRecord, name, value)
+            namespace[name] = getattr(recordclass, name)
 
     __post_init__ = getattr(recordclass, "__post_init__", None)
     if callable(__post_init__):
-        setattr(_FragmentRecord, "__post_init__", __post_init__)
+        namespace["__post_init__"] = __post_init__
+
+    _FragmentRecord = type(recordclass.__name__, (DatasetView,), namespace)
 
     original_module = getmodule(recordclass)
     setattr(original_module, recordclass.__name__, _FragmentRecord)
 
+    _fragment_cache[recordclass] = _FragmentRecord
+    _fragment_classes.add(_FragmentRecord)
+
     return cast(type[_T], _FragmentRecord)
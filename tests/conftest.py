@@ -0,0 +1,44 @@
+"""
+Provide shared fixtures of the test suite.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+# Scan angles reaching past the Earth limb, so that the grids have
+# pixels both on and off the Earth disk.
+_EXTENT = 0.16
+
+_ROWS = 20
+_COLUMNS = 30
+
+
+@pytest.fixture
+def abi_path(tmp_path: Path) -> Path:
+    """
+    Create a small ABI Level 2 like dataset with projection information.
+
+    Returns
+    -------
+    Path
+        The path of the dataset file.
+    """
+    path = tmp_path / "abi.nc"
+    with Dataset(path, "w") as record:
+        record.createDimension("y", _ROWS)
+        record.createDimension("x", _COLUMNS)
+        x = record.createVariable("x", "f4", ("x",))
+        x[:] = np.linspace(-_EXTENT, _EXTENT, _COLUMNS)
+        y = record.createVariable("y", "f4", ("y",))
+        y[:] = np.linspace(_EXTENT, -_EXTENT, _ROWS)
+        projection = record.createVariable("goes_imager_projection", "i4")
+        projection.longitude_of_projection_origin = np.float64(-75.0)
+        projection.perspective_point_height = np.float64(35786023.0)
+        projection.sweep_angle_axis = "x"
+        projection.semi_major_axis = np.float64(6378137.0)
+        projection.semi_minor_axis = np.float64(6356752.31414)
+        projection.inverse_flattening = np.float64(298.2572221)
+    return path
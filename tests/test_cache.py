@@ -0,0 +1,82 @@
+"""
+Test the memoization of dataset views and the calculated grid cache.
+"""
+
+from pathlib import Path
+from typing import Any, NoReturn
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+from goesdr import GOESGeodeticGrid, GOESProjection
+from goesdr.netcdf import memo
+
+
+def _assert_same_grids(
+    grid: GOESGeodeticGrid, expected: GOESGeodeticGrid
+) -> None:
+    for name in ("latitude", "longitude"):
+        data = getattr(grid, name)
+        expected_data = getattr(expected, name)
+        np.testing.assert_array_equal(data.data, expected_data.data)
+        np.testing.assert_array_equal(data.mask, expected_data.mask)
+
+
+def test_view_memo_round_trip(
+    abi_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(memo.CACHE_DIR_VARIABLE, str(tmp_path / "cache"))
+
+    with Dataset(abi_path) as record:
+        projection = GOESProjection(record)
+        key = memo.make_key(
+            record,
+            GOESProjection,
+            GOESProjection._plan_signature,  # pylint: disable=W0212
+        )
+        assert key is not None
+        values = memo.load(key)
+        assert values is not None
+        cached = GOESProjection(record)
+
+    assert values.keys() == vars(projection).keys()
+    for name, value in vars(projection).items():
+        np.testing.assert_array_equal(getattr(cached, name), value)
+
+
+def test_grid_cache_round_trip(
+    abi_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with Dataset(abi_path) as record:
+        expected = GOESGeodeticGrid.calculate(record)
+        monkeypatch.setenv(memo.CACHE_DIR_VARIABLE, str(tmp_path / "cache"))
+        stored = GOESGeodeticGrid.calculate(record)
+
+        def _not_calculated(*_: Any) -> NoReturn:
+            raise AssertionError("The cached grid was not loaded.")
+
+        monkeypatch.setattr(
+            GOESGeodeticGrid, "_calculate_latlon_grid", _not_calculated
+        )
+        loaded = GOESGeodeticGrid.calculate(record)
+
+    assert len(list((tmp_path / "cache" / "grids").glob("*.nc"))) == 1
+    _assert_same_grids(stored, expected)
+    _assert_same_grids(loaded, expected)
+
+
+def test_broken_cache_dir_does_not_fail_construction(
+    abi_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_file = tmp_path / "cache"
+    cache_file.write_text("not a directory")
+
+    with Dataset(abi_path) as record:
+        expected = GOESGeodeticGrid.calculate(record)
+        monkeypatch.setenv(memo.CACHE_DIR_VARIABLE, str(cache_file))
+        projection = GOESProjection(record)
+        grid = GOESGeodeticGrid.calculate(record)
+
+    assert projection.semi_major_axis == np.float64(6378137.0)
+    _assert_same_grids(grid, expected)
@@ -0,0 +1,86 @@
+"""
+Test the latitude and longitude grid calculation backends.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+from goesdr import GOESGeodeticGrid, GOESGeodeticGridScratch
+from goesdr.grid import (
+    ProjectionParameters,
+    calculate_latlon_grid_goesdr,
+    calculate_latlon_grid_numba,
+)
+
+# Scan angles reaching past the Earth limb, so that the grids have
+# pixels both on and off the Earth disk.
+_EXTENT = 0.16
+
+
+def _make_parameters(rows: int, columns: int) -> ProjectionParameters:
+    x = np.linspace(-_EXTENT, _EXTENT, columns)
+    y = np.linspace(_EXTENT, -_EXTENT, rows)
+    return ProjectionParameters(
+        (np.float64(-75.0), np.float64(35786023.0), "x"),
+        (
+            np.float64(6378137.0),
+            np.float64(6356752.31414),
+            np.float64(298.2572221),
+        ),
+        (x, y),
+    )
+
+
+def test_goesdr_mask_flags_off_disk_pixels() -> None:
+    parameters = _make_parameters(37, 45)
+    mask = np.empty((37, 45), dtype=np.bool_)
+
+    lat, lon = calculate_latlon_grid_goesdr(parameters, mask)
+
+    assert lat.dtype == lon.dtype == np.float32
+    assert mask.any() and not mask.all()
+    np.testing.assert_array_equal(mask, np.isnan(lat))
+    np.testing.assert_array_equal(mask, np.isnan(lon))
+
+
+def test_numba_matches_goesdr() -> None:
+    pytest.importorskip("numba")
+    parameters = _make_parameters(37, 45)
+    mask = np.empty((37, 45), dtype=np.bool_)
+    compiled_mask = np.empty((37, 45), dtype=np.bool_)
+
+    lat, lon = calculate_latlon_grid_goesdr(parameters, mask)
+    compiled_lat, compiled_lon = calculate_latlon_grid_numba(
+        parameters, compiled_mask
+    )
+
+    np.testing.assert_array_equal(compiled_mask, mask)
+    np.testing.assert_array_equal(compiled_lat, lat)
+    np.testing.assert_array_equal(compiled_lon, lon)
+
+
+def test_calculate_with_scratch(abi_path: Path) -> None:
+    with Dataset(abi_path) as record:
+        expected = GOESGeodeticGrid.calculate(record)
+        shape = (record.dimensions["y"].size, record.dimensions["x"].size)
+        scratch = GOESGeodeticGridScratch(shape)
+        for _ in range(2):
+            grid = GOESGeodeticGrid.calculate(record, scratch=scratch)
+
+        with pytest.raises(ValueError):
+            GOESGeodeticGrid.calculate(
+                record, scratch=GOESGeodeticGridScratch((5, 5))
+            )
+
+    assert grid.latitude.data is scratch.latitude
+    assert grid.longitude.data is scratch.longitude
+    assert scratch.mask.flags.writeable
+    assert not grid.latitude.mask.flags.writeable
+    np.testing.assert_array_equal(grid.latitude.data, expected.latitude.data)
+    np.testing.assert_array_equal(
+        grid.longitude.data, expected.longitude.data
+    )
+    np.testing.assert_array_equal(grid.latitude.mask, expected.latitude.mask)
@@ -0,0 +1,47 @@
+"""
+Test the optional compilation of dataset view field conversions.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from netCDF4 import Dataset  # pylint: disable=no-name-in-module
+
+from goesdr.array import ArrayBool, ArrayFloat32
+from goesdr.netcdf import DatasetView, jit, variable
+
+
+def _rescale(x: ArrayFloat32) -> ArrayFloat32:
+    return x * np.float32(2.0)
+
+
+def _make_dataset(path: Path) -> None:
+    with Dataset(path, "w") as record:
+        record.createDimension("rows", 3)
+        record.createDimension("columns", 4)
+        latitude = record.createVariable(
+            "latitude", "f4", ("rows", "columns"), fill_value=np.float32(-1)
+        )
+        latitude[:] = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+
+def test_view_with_jitted_convert(tmp_path: Path) -> None:
+    path = tmp_path / "latlon.nc"
+    _make_dataset(path)
+
+    class _Latitude(DatasetView):
+        data: ArrayFloat32 = variable("latitude").data(convert=jit(_rescale))
+        mask: ArrayBool = variable("latitude").mask()
+
+    with Dataset(path) as record:
+        latitude = _Latitude(record)
+
+    expected = 2.0 * np.arange(12, dtype=np.float32).reshape(3, 4)
+    assert latitude.data.dtype == np.float32
+    np.testing.assert_array_equal(latitude.data, expected)
+    assert not latitude.mask.any()
+
+
+def test_jit_returns_non_functions_unchanged() -> None:
+    for convert in (float, np.float32, np.sqrt, len):
+        assert jit(convert) is convert